@@ -1,29 +1,326 @@
 # ===========================================================================================
 #                              SQLAlchemy Database with StudentDetails
 # ===========================================================================================
-from flask import Flask, request, redirect, url_for, render_template, flash
+from flask import Flask, Blueprint, current_app, request, redirect, url_for, render_template, flash, g, jsonify, abort, has_request_context, send_file, send_from_directory, session
 from flask_sqlalchemy import SQLAlchemy
+from flask_sqlalchemy.session import Session as FlaskSQLAlchemySession
 from flask_bcrypt import Bcrypt
 from flask_login import LoginManager, UserMixin, login_user, logout_user, current_user, login_required
+from flask_mail import Mail, Message
 from werkzeug.utils import secure_filename
-from datetime import datetime
+from markupsafe import Markup
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, configure_mappers, make_transient_to_detached, object_session
+from logging.handlers import RotatingFileHandler
+from contextlib import contextmanager
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from xml.etree import ElementTree
+# NumPy, pypdf, Pillow, Brotli, Alembic and the MySQL/PostgreSQL dialects are imported
+# where they are used, so starting a worker does not pay for them
+import base64
+import click
+import csv
+import functools
+import gzip
+import hashlib
+import importlib
+import io
+import json
+import logging
+import math
+import mimetypes
 import os
+import random
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+import zipfile
+import zlib
 
-app = Flask(__name__)
-app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///site.db'
-app.config['SECRET_KEY'] = 'your_secret_key'
-app.config['UPLOAD_FOLDER'] = 'static/resume'
-app.config['ALLOWED_EXTENSIONS'] = {'pdf', 'doc', 'docx'}
+# ===========================================================================================
+#                              Application factory
+# ===========================================================================================
+# create_app() builds the app: default_config (filled in section by section below) plus
+# any overrides, then the extensions and blueprints. Importing this module creates no app,
+# opens no connection and writes nothing, so gunicorn can preload it in the master and fork
+# cheap workers. Each blueprint owns one area's routes, template helpers and CLI commands;
+# URLs are unchanged. Hooks that apply to every request (before/after_app_request, app-wide
+# error handlers) belong to no area and are all registered on ops_bp.
+default_config = {}
+default_config['SECRET_KEY'] = 'your_secret_key'
+default_config['BCRYPT_LOG_ROUNDS'] = int(os.environ.get('BCRYPT_LOG_ROUNDS', 12))  # bcrypt cost
+
+auth_bp = Blueprint('auth', __name__, cli_group=None)
+student_bp = Blueprint('student', __name__, cli_group=None)
+company_bp = Blueprint('company', __name__, cli_group=None)
+profile_bp = Blueprint('profile', __name__, cli_group=None)
+resume_bp = Blueprint('resume', __name__, cli_group=None)
+vacancy_bp = Blueprint('vacancy', __name__, cli_group=None)
+ops_bp = Blueprint('ops', __name__, cli_group=None)
+api_bp = Blueprint('api', __name__, cli_group=None)
+BLUEPRINTS = [auth_bp, student_bp, company_bp, profile_bp, resume_bp, vacancy_bp, ops_bp, api_bp]
 
-db = SQLAlchemy(app)
-bcrypt = Bcrypt(app)
-login_manager = LoginManager(app)
-login_manager.login_view = 'login'
+# ===========================================================================================
+#                              Database configuration
+# ===========================================================================================
+# Everything comes from the environment:
+#   DATABASE_URL            primary database, e.g. mysql+mysqldb://user:pass@db/jobcare
+#                           (defaults to the local SQLite file, which runs in WAL mode)
+#   DATABASE_REPLICA_URLS   comma-separated read replicas for routes marked @read_replica
+#   DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE, DB_POOL_TIMEOUT, DB_POOL_PRE_PING
+#                           connection pool tuning for server databases, per process
+default_config['SQLALCHEMY_DATABASE_URI'] = os.environ.get('DATABASE_URL', 'sqlite:///site.db')
+default_config['DATABASE_REPLICA_URLS'] = [url.strip() for url in os.environ.get('DATABASE_REPLICA_URLS', '').split(',') if url.strip()]
+default_config['SQLITE_WAL'] = True
+default_config['REPLICA_READ_AFTER_WRITE_SECONDS'] = 5  # keep a user on the primary this long after they write
+
+# Applied by create_app unless the database is SQLite
+DATABASE_POOL_OPTIONS = {
+    'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+    'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+    'pool_recycle': int(os.environ.get('DB_POOL_RECYCLE', 280)),  # below MySQL's usual idle timeouts
+    'pool_timeout': int(os.environ.get('DB_POOL_TIMEOUT', 10)),
+    'pool_pre_ping': os.environ.get('DB_POOL_PRE_PING', '1') != '0',
+}
+
+# SQLite allows one writer at a time; WAL lets readers carry on while it writes
+@event.listens_for(Engine, 'connect')
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    if isinstance(dbapi_connection, sqlite3.Connection) and current_app.config['SQLITE_WAL']:
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA busy_timeout=5000')
+        cursor.close()
+
+def replica_reads_allowed():
+    return (has_request_context()
+            and g.get('read_replica', False)
+            and bool(current_app.config['SQLALCHEMY_BINDS'])
+            and session.get('primary_until', 0) < time.time())
+
+# Sends plain SELECTs from @read_replica routes to a random replica; flushes, DML and
+# everything else stay on the primary
+class RoutingSession(FlaskSQLAlchemySession):
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if bind is None and not self._flushing and getattr(clause, 'is_select', False) and replica_reads_allowed():
+            return self._db.engines[random.choice(list(current_app.config['SQLALCHEMY_BINDS']))]
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
+
+def read_replica(view):
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        g.read_replica = True
+        return view(*args, **kwargs)
+    return wrapper
+
+db = SQLAlchemy(session_options={'class_': RoutingSession})
+
+# The engine's own dialect INSERT, which adds ON CONFLICT (SQLite, PostgreSQL) or
+# ON DUPLICATE KEY UPDATE and IGNORE (MySQL); None on other databases. The engine has
+# already loaded its dialect package, so the import is free.
+def dialect_insert(model):
+    dialect = db.engine.dialect.name
+    if dialect in ('sqlite', 'postgresql', 'mysql'):
+        return importlib.import_module('sqlalchemy.dialects.' + dialect).insert(model)
+    return None
+
+# The FTS5 search table and its shadow tables are created by the search backend, not the models
+def include_in_migrations(object, name, type_, reflected, compare_to):
+    return not (type_ == 'table' and name.startswith('vacancy_fts'))
+
+# Flask-Migrate pulls in Alembic, which only `flask db ...` and deploys need. The app gets
+# a placeholder `db` command group that sets Flask-Migrate up the first time it is used.
+def init_migrations(app):
+    from flask_migrate import Migrate
+    if 'migrate' not in app.extensions:
+        Migrate(app, db, render_as_batch=True, include_object=include_in_migrations)  # batch mode lets SQLite alter tables
+
+class MigrationCommands(click.Group):
+    def load(self):
+        init_migrations(current_app._get_current_object())
+        from flask_migrate.cli import db as migration_commands
+        return migration_commands
+
+    def list_commands(self, ctx):
+        return self.load().list_commands(ctx)
+
+    def get_command(self, ctx, name):
+        return self.load().get_command(ctx, name)
+
+# Tables of the baseline migration (0001): what db.create_all() built before migrations existed
+BASELINE_TABLES = {'user', 'profile', 'resume', 'student_details', 'vacancy', 'application'}
+
+# Bring the database up to the latest migration. A database created by db.create_all()
+# before migrations existed has no alembic_version table; it is stamped at the baseline
+# first, so upgrade() does not try to create its tables again. One that also has later
+# tables cannot be placed automatically and has to be stamped by hand.
+def upgrade_database(app):
+    init_migrations(app)
+    from flask_migrate import stamp, upgrade
+    tables = set(db.inspect(db.engine).get_table_names())
+    if tables and 'alembic_version' not in tables:
+        if tables & (set(db.metadata.tables) - BASELINE_TABLES):
+            raise SystemExit('The database has tables but no migration history. Run `flask db stamp <revision>` '
+                             'with the revision its schema matches (`flask db stamp 0001` if it predates '
+                             'migrations), then `flask db upgrade`.')
+        app.logger.warning('Database has no migration history; stamping it at the baseline revision 0001')
+        stamp(revision='0001')
+    upgrade()
+
+# After a write, pin the user to the primary for a moment so replica lag never hides
+# their own change (e.g. applied_vacancies right after applying)
+@event.listens_for(Session, 'after_commit')
+def remember_primary_write(db_session):
+    if has_request_context():
+        g.wrote_to_primary = True
+
+@ops_bp.after_app_request
+def pin_writer_to_primary(response):
+    if g.get('wrote_to_primary') and current_app.config['SQLALCHEMY_BINDS']:
+        session['primary_until'] = time.time() + current_app.config['REPLICA_READ_AFTER_WRITE_SECONDS']
+    return response
+bcrypt = Bcrypt()
+login_manager = LoginManager()
+login_manager.login_view = 'auth.login'
 
-# User Loader
-@login_manager.user_loader
-def load_user(user_id):
-    return User.query.get(int(user_id))
+# ===========================================================================================
+#                              SQL instrumentation
+# ===========================================================================================
+default_config['SLOW_QUERY_THRESHOLD_MS'] = 200
+default_config['SLOW_QUERY_LOG'] = 'slow_queries.log'
+default_config['SQL_STATS_TOKEN'] = os.environ.get('SQL_STATS_TOKEN')  # lets operators read /ops/sql_stats
+SLOWEST_STATEMENTS_KEPT = 5
+
+# Aggregated per-endpoint stats, shared by every request handled by this process
+sql_stats = {}
+sql_stats_lock = threading.Lock()
+
+slow_query_logger = logging.getLogger('jobcare.slow_queries')
+slow_query_logger.propagate = False
+
+def get_slow_query_logger():
+    # The rotating file is opened on the first slow statement, not at import time
+    if not slow_query_logger.handlers:
+        handler = RotatingFileHandler(current_app.config['SLOW_QUERY_LOG'], maxBytes=1024 * 1024, backupCount=5)
+        handler.setFormatter(logging.Formatter('%(asctime)s %(message)s'))
+        slow_query_logger.addHandler(handler)
+        slow_query_logger.setLevel(logging.INFO)
+    return slow_query_logger
+
+def new_sql_profile():
+    return {'statements': 0, 'db_time_ms': 0.0, 'slowest': []}
+
+def add_statement(profile, statement, elapsed_ms):
+    profile['statements'] += 1
+    profile['db_time_ms'] += elapsed_ms
+    profile['slowest'].append((elapsed_ms, statement))
+    profile['slowest'].sort(key=lambda item: item[0], reverse=True)
+    del profile['slowest'][SLOWEST_STATEMENTS_KEPT:]
+
+# Attribute statements run inside a helper (e.g. load_user) to that helper as well as the endpoint
+@contextmanager
+def sql_scope(name):
+    previous = g.get('sql_scope')
+    g.sql_scope = name
+    try:
+        yield
+    finally:
+        g.sql_scope = previous
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed_ms = (time.perf_counter() - conn.info['query_start_time'].pop()) * 1000
+    record_statement(statement, elapsed_ms)
+
+# A statement that raises never reaches after_cursor_execute; it still took database time
+# (a lock wait that timed out is often the slowest statement of all)
+@event.listens_for(Engine, 'handle_error')
+def handle_cursor_error(context):
+    started = context.connection.info.get('query_start_time') if context.connection is not None else None
+    if not started:
+        return  # failed before the statement was sent
+    elapsed_ms = (time.perf_counter() - started.pop()) * 1000
+    record_statement(context.statement, elapsed_ms, failed=True)
+
+def record_statement(statement, elapsed_ms, failed=False):
+    if not has_request_context() or 'sql_profiles' not in g:
+        return
+
+    labels = [request.endpoint or request.path]
+    if g.get('sql_scope'):
+        labels.append(g.sql_scope)
+    for label in labels:
+        add_statement(g.sql_profiles.setdefault(label, new_sql_profile()), statement, elapsed_ms)
+
+    if elapsed_ms >= current_app.config['SLOW_QUERY_THRESHOLD_MS']:
+        get_slow_query_logger().info('%.1fms endpoint=%s%s %s', elapsed_ms, labels[-1], ' failed' if failed else '',
+                                     ' '.join(statement.split()))
+
+# The endpoint is always recorded, so requests that run no SQL (e.g. cache hits) count too
+@ops_bp.before_app_request
+def start_sql_profile():
+    g.sql_profiles = {request.endpoint or request.path: new_sql_profile()}
+
+@ops_bp.after_app_request
+def record_sql_profile(response):
+    profiles = g.pop('sql_profiles', None)
+    if profiles is None:
+        return response
+
+    with sql_stats_lock:
+        for label, profile in profiles.items():
+            stats = sql_stats.setdefault(label, dict(new_sql_profile(), requests=0, max_db_time_ms=0.0))
+            stats['requests'] += 1
+            stats['max_db_time_ms'] = max(stats['max_db_time_ms'], profile['db_time_ms'])
+            stats['statements'] += profile['statements']
+            stats['db_time_ms'] += profile['db_time_ms']
+            stats['slowest'] = sorted(stats['slowest'] + profile['slowest'], key=lambda item: item[0], reverse=True)[:SLOWEST_STATEMENTS_KEPT]
+
+    # Expose the request's own numbers to developers
+    if current_app.debug:
+        endpoint_profile = profiles.get(request.endpoint or request.path, new_sql_profile())
+        response.headers['X-SQL-Queries'] = str(endpoint_profile['statements'])
+        response.headers['X-SQL-Time-ms'] = f"{endpoint_profile['db_time_ms']:.2f}"
+    return response
+
+# Operator views are open in debug mode and otherwise need the X-Ops-Token header
+def require_ops_access():
+    token = current_app.config['SQL_STATS_TOKEN']
+    if not current_app.debug and (not token or request.headers.get('X-Ops-Token') != token):
+        abort(404)
+
+# Per-endpoint SQL stats for operators, most expensive endpoints first
+@ops_bp.route('/ops/sql_stats')
+def sql_stats_view():
+    require_ops_access()
+
+    with sql_stats_lock:
+        endpoints = [
+            {
+                'endpoint': label,
+                'requests': stats['requests'],
+                'statements': stats['statements'],
+                'avg_statements': stats['statements'] / stats['requests'],
+                'db_time_ms': round(stats['db_time_ms'], 2),
+                'avg_db_time_ms': round(stats['db_time_ms'] / stats['requests'], 2),
+                'max_db_time_ms': round(stats['max_db_time_ms'], 2),
+                'slowest': [{'ms': round(ms, 2), 'statement': statement} for ms, statement in stats['slowest']],
+            }
+            for label, stats in sql_stats.items()
+        ]
+    endpoints.sort(key=lambda item: item['db_time_ms'], reverse=True)
+    return jsonify(endpoints=endpoints)
 
 # User Login register Model
 class User(db.Model, UserMixin):
@@ -36,88 +333,315 @@ class User(db.Model, UserMixin):
     def __repr__(self):
         return f"User('{self.username}', '{self.email}', '{self.role}')"
 
+# ------------------------------------------------------------------
+#                       Identity cache
+# ------------------------------------------------------------------
+default_config['USER_CACHE_SIZE'] = 10000
+default_config['USER_CACHE_TTL'] = 60  # seconds
+
+# Bounded LRU cache whose entries also expire after `ttl` seconds
+class TTLCache:
+    def __init__(self, maxsize, ttl):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._data.get(key)
+            if item is not None and item[0] > time.monotonic():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return item[1]
+            if item is not None:
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else None,
+            }
+
+# The caches hold rows from one app's database, so every app gets its own set: create_app
+# keeps them in app.extensions['caches'] and code looks them up through the current app.
+def app_cache(name):
+    return current_app.extensions['caches'][name]
+
+# The 'user' cache holds column values of recently loaded users, keyed by user id. Snapshots
+# rather than ORM objects are cached, because an instance must not outlive the session
+# that loaded it.
+USER_COLUMNS = [attr.key for attr in db.inspect(User).column_attrs]
+
+@login_manager.user_loader
+def load_user(user_id):
+    user_id = int(user_id)
+    snapshot = app_cache('user').get(user_id)
+    if snapshot is None:
+        with sql_scope('load_user'):
+            user = db.session.get(User, user_id)
+        if user is not None:
+            app_cache('user').set(user_id, {key: getattr(user, key) for key in USER_COLUMNS})
+        return user
+
+    # Rebuild the user and attach it to this request's session without a SELECT;
+    # relationships such as user.profile still lazy-load as usual.
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+# Drop cached users when their row changes. Ids are dropped at flush and again after
+# commit, so a concurrent request cannot re-cache the old row in between.
+@event.listens_for(User, 'after_update')
+@event.listens_for(User, 'after_delete')
+def invalidate_cached_user(mapper, connection, target):
+    app_cache('user').invalidate(target.id)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault('changed_user_ids', set()).add(target.id)
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_committed_users(session):
+    for user_id in session.info.pop('changed_user_ids', ()):
+        app_cache('user').invalidate(user_id)
+
+@event.listens_for(Session, 'after_rollback')
+def forget_rolled_back_users(session):
+    session.info.pop('changed_user_ids', None)
+
+@ops_bp.route('/ops/cache_stats')
+def cache_stats_view():
+    require_ops_access()
+    return jsonify(user_cache=app_cache('user').stats(), dashboard_cache=app_cache('dashboard').stats(),
+                   fragment_cache=app_cache('fragment').local.stats())
+
+# ------------------------------------------------------------------
+#                       Password hashing pool
+# ------------------------------------------------------------------
+# bcrypt is deliberately slow, so /register and /login hand it to a bounded process pool
+# instead of burning the request worker's CPU. At most PASSWORD_HASH_MAX_PENDING hashes
+# may be queued or running; beyond that, or when a hash takes longer than
+# PASSWORD_HASH_TIMEOUT, requests fail fast with a 503 rather than pile up.
+# PASSWORD_HASH_WORKERS = 0 hashes inline, which is handy for development.
+#
+# The pool and the limit are per process. Under gunicorn a host runs up to
+# WEB_CONCURRENCY x PASSWORD_HASH_WORKERS bcrypt processes and admits up to
+# WEB_CONCURRENCY x PASSWORD_HASH_MAX_PENDING hashes, hence one pool process per worker by
+# default. A sync worker (GUNICORN_THREADS = 1) never has more than one hash in flight and
+# still waits for it, so there the limit never triggers and only the timeout applies;
+# the admission limit matters with threaded workers.
+default_config['PASSWORD_HASH_WORKERS'] = int(os.environ.get('PASSWORD_HASH_WORKERS', 1))
+default_config['PASSWORD_HASH_MAX_PENDING'] = int(os.environ.get('PASSWORD_HASH_MAX_PENDING', 4 * max(default_config['PASSWORD_HASH_WORKERS'], 1)))
+default_config['PASSWORD_HASH_TIMEOUT'] = 10  # seconds to wait for a result
+
+class PasswordHashPoolBusy(Exception):
+    pass
+
+# These run inside the pool processes, where `bcrypt` is this module's Flask-Bcrypt object
+def hash_password_job(password, rounds):
+    return bcrypt.generate_password_hash(password, rounds).decode('utf-8')
+
+def check_password_job(pw_hash, password):
+    return bcrypt.check_password_hash(pw_hash, password)
+
+class PasswordHashPool:
+    def __init__(self):
+        self._executor = None
+        self._executor_pid = None
+        self._slots = None
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    # The pool and its admission semaphore are created lazily in each process
+    def _get_executor(self):
+        with self._lock:
+            if self._executor_pid != os.getpid():
+                workers = current_app.config['PASSWORD_HASH_WORKERS']
+                self._executor = ProcessPoolExecutor(max_workers=workers) if workers > 0 else None
+                self._slots = threading.BoundedSemaphore(max(current_app.config['PASSWORD_HASH_MAX_PENDING'], 1))
+                self._executor_pid = os.getpid()
+            return self._executor
+
+    def run(self, job, *args):
+        executor = self._get_executor()
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHashPoolBusy()
+
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        finish = functools.partial(self._finish, self._slots, time.perf_counter())
+        if executor is None:
+            try:
+                return job(*args)
+            finally:
+                finish()
+
+        # The slot is held until the hash is done, even when the request stops waiting for it
+        try:
+            future = executor.submit(job, *args)
+        except BaseException:
+            finish()
+            raise
+        future.add_done_callback(lambda future: finish())
+        try:
+            return future.result(timeout=current_app.config['PASSWORD_HASH_TIMEOUT'])
+        except FutureTimeoutError:
+            with self._lock:
+                self.timed_out += 1
+            raise PasswordHashPoolBusy()
+
+    def _finish(self, slots, started):
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        slots.release()
+        with self._lock:
+            self.in_flight -= 1
+            self.completed += 1
+            self.total_ms += elapsed_ms
+            self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def generate_password_hash(self, password):
+        return self.run(hash_password_job, password, current_app.config['BCRYPT_LOG_ROUNDS'])
+
+    def check_password_hash(self, pw_hash, password):
+        return self.run(check_password_job, pw_hash, password)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'workers': current_app.config['PASSWORD_HASH_WORKERS'],
+                'max_pending': current_app.config['PASSWORD_HASH_MAX_PENDING'],
+                'in_flight': self.in_flight,
+                'max_in_flight': self.max_in_flight,
+                'completed': self.completed,
+                'rejected': self.rejected,
+                'timed_out': self.timed_out,
+                'avg_ms': round(self.total_ms / self.completed, 2) if self.completed else None,
+                'max_ms': round(self.max_ms, 2),
+            }
+
+password_hasher = PasswordHashPool()
+
+@ops_bp.app_errorhandler(PasswordHashPoolBusy)
+def password_hash_pool_busy(error):
+    return 'The server is busy, please try again in a moment.', 503, {'Retry-After': '1'}
+
+@ops_bp.route('/ops/password_hash_stats')
+def password_hash_stats_view():
+    require_ops_access()
+    return jsonify(password_hasher.stats())
+
 # # ------------------------------------------------------------
 #                       Routes
 # # ------------------------------------------------------------
 # Home Page
-@app.route('/')
+@auth_bp.route('/')
 def index():
     return render_template('index.html', user=current_user)
 
 # Registration Route
-@app.route('/register', methods=['GET', 'POST'])
+@auth_bp.route('/register', methods=['GET', 'POST'])
 def register():
     if request.method == 'POST':
         username = request.form['username']
         email = request.form['email']
-        password = bcrypt.generate_password_hash(request.form['password']).decode('utf-8')
         role = request.form['role']
 
-        # Ensure valid roles
+        # Ensure valid roles before paying for the hash
         if role not in ['student', 'company']:
             flash('Invalid role selected', 'danger')
-            return redirect(url_for('register'))
+            return redirect(url_for('auth.register'))
+
+        password = password_hasher.generate_password_hash(request.form['password'])
 
         user = User(username=username, email=email, password=password, role=role)
         db.session.add(user)
         db.session.commit()
 
         flash('Account created successfully! You can now log in.', 'success')
-        return redirect(url_for('login'))
+        return redirect(url_for('auth.login'))
     return render_template('register.html')
 
-@app.route('/login', methods=['GET', 'POST'])
+@auth_bp.route('/login', methods=['GET', 'POST'])
 def login():
     if request.method == 'POST':
         email = request.form['email']
         password = request.form['password']
         user = User.query.filter_by(email=email).first()
 
-        if user and bcrypt.check_password_hash(user.password, password):
+        if user and password_hasher.check_password_hash(user.password, password):
             login_user(user)
             flash('Logged in successfully!', 'success')
 
             # Redirect based on user role
             if user.role == 'company':
-                return redirect(url_for('companyDashboard'))
+                return redirect(url_for('company.companyDashboard'))
             elif user.role == 'student':
-                return redirect(url_for('studentDashboard'))
+                return redirect(url_for('student.studentDashboard'))
             else:
                 flash('Invalid role. Contact support.', 'danger')
-                return redirect(url_for('login'))
+                return redirect(url_for('auth.login'))
         else:
             flash('Login failed. Check your credentials.', 'danger')
     return render_template('login.html')
 # -----------------------------------------------------------------
 # Logout Route
-@app.route('/logout')
+@auth_bp.route('/logout')
 @login_required
 def logout():
     logout_user()
     flash('You have been logged out.', 'info')
-    return redirect(url_for('login'))
+    return redirect(url_for('auth.login'))
 # ------------------------------------------------------------------
 # Admin Dashboard Route
-@app.route('/companyDashboard')
+@company_bp.route('/companyDashboard')
 @login_required
 def companyDashboard():  # Changed function name to adminDashboard
     if current_user.role == 'company':
-        return render_template('companyDashboard.html', user=current_user)
+        dashboard = load_dashboard(current_user)
+        return render_template('companyDashboard.html', user=current_user, profile=dashboard['profile'])
     else:
         flash('Access Denied!', 'danger')
-        return redirect(url_for('index'))
-
-# -------------------------------------------------------------------
-# User Loader
-@login_manager.user_loader
-def load_user(user_id):
-    return User.query.get(int(user_id))
+        return redirect(url_for('auth.index'))
 
 # -------------------------------------------------------------------
 # StudentDetails Model
 class StudentDetails(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     education = db.Column(db.String(500), nullable=True)
     skills = db.Column(db.String(500), nullable=True)
     contact = db.Column(db.String(15), nullable=True)
@@ -126,31 +650,28 @@ class StudentDetails(db.Model):
     def __repr__(self):
         return f"StudentDetails('{self.education}', '{self.skills}', '{self.contact}')"
 
-# ------------------------------------------------------------------------------------------
-# Helper function for file uploads
-def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
-
 # ------------------------------------------------------------------------------------------
 # Route: Student Dashboard
-@app.route('/studentDashboard')
+@student_bp.route('/studentDashboard')
 @login_required
 def studentDashboard():
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
-    student_details = StudentDetails.query.filter_by(user_id=current_user.id).first()
-    return render_template('studentDashboard.html', user=current_user, details=student_details)
+        return redirect(url_for('auth.index'))
+    dashboard = load_dashboard(current_user)
+    return render_template('studentDashboard.html', user=current_user, profile=dashboard['profile'],
+                           details=dashboard['details'], resumes=dashboard['resumes'],
+                           recommendations=dashboard['recommendations'])
 
 # ------------------------------------------------------------------------------------------
 # Route: Create Student Details
 
-@app.route('/create_student_details', methods=['GET', 'POST'])
+@student_bp.route('/create_student_details', methods=['GET', 'POST'])
 @login_required
 def create_student_details():
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     if request.method == 'POST':
         education = request.form['education']
@@ -167,62 +688,65 @@ def create_student_details():
             # resume=resume_filename
         )
         db.session.add(details)
+        index_student_skills(current_user.id, skills)
         db.session.commit()
         flash('Details added successfully!', 'success')
-        return redirect(url_for('studentDashboard'))
+        return redirect(url_for('student.studentDashboard'))
 
     return render_template('create_student_details.html')
 
 # ------------------------------------------------------------------------------------------
 # Route: Update Student Details
-@app.route('/update_student_details', methods=['GET', 'POST'])
+@student_bp.route('/update_student_details', methods=['GET', 'POST'])
 @login_required
 def update_student_details():
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     details = StudentDetails.query.filter_by(user_id=current_user.id).first()
     if not details:
         flash("No details found to update!", "danger")
-        return redirect(url_for('create_student_details'))
+        return redirect(url_for('student.create_student_details'))
 
     if request.method == 'POST':
         details.education = request.form['education']
         details.skills = request.form['skills']
         details.contact = request.form['contact']
         details.address = request.form['address']
+        index_student_skills(current_user.id, details.skills)
         db.session.commit()
         flash('Details updated successfully!', 'success')
-        return redirect(url_for('studentDashboard'))
+        return redirect(url_for('student.studentDashboard'))
 
     return render_template('update_student_details.html', details=details)
 
 # ------------------------------------------------------------------------------------------
 # Route: Delete Student Details
-@app.route('/delete_student_details', methods=['POST'])
+@student_bp.route('/delete_student_details', methods=['POST'])
 @login_required
 def delete_student_details():
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     details = StudentDetails.query.filter_by(user_id=current_user.id).first()
     if details:
         db.session.delete(details)
+        index_student_skills(current_user.id, None)
         db.session.commit()
         flash('Details deleted successfully!', 'info')
     else:
         flash("No details found to delete!", "danger")
 
-    return redirect(url_for('studentDashboard'))
+    return redirect(url_for('student.studentDashboard'))
 
 # ================================================================
 #                    student profile 
 # ================================================================
 class Profile(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     full_name = db.Column(db.String(100), nullable=False)
     bio = db.Column(db.Text, nullable=True)
     profile_pic = db.Column(db.String(120), nullable=True)  # Store the profile picture filename
@@ -231,20 +755,306 @@ class Profile(db.Model):
     def __repr__(self):
         return f"Profile('{self.full_name}', '{self.profile_pic}')"
 
-
-from werkzeug.utils import secure_filename
-import os
-
-app.config['UPLOAD_FOLDER'] = 'static/profile_pics'  # Folder where profile pictures will be stored
-app.config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'gif'}  # Allowed image extensions
+default_config['UPLOAD_FOLDER'] = 'static/profile_pics'  # Folder where profile pictures will be stored
+default_config['ALLOWED_EXTENSIONS'] = {'png', 'jpg', 'jpeg', 'gif'}  # Allowed image extensions
 
 # Helper function to check file extension
 def allowed_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_EXTENSIONS']
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in current_app.config['ALLOWED_EXTENSIONS']
+
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# Stream an upload into a temporary file in `folder` in chunks while hashing it.
+# Returns (sha256, size, tmp_path).
+def stage_hashed_upload(file, folder):
+    os.makedirs(folder, exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    fd, tmp_path = tempfile.mkstemp(dir=folder, prefix='.upload-')
+    try:
+        with os.fdopen(fd, 'wb') as out:
+            for chunk in iter(lambda: file.stream.read(UPLOAD_CHUNK_SIZE), b''):
+                digest.update(chunk)
+                out.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        remove_file(tmp_path)
+        raise
+    return digest.hexdigest(), size, tmp_path
+
+# Move a staged upload to its final path. It replaces identical content that is already
+# there rather than trusting it: that copy may be on its way out with its last reference.
+def place_hashed_upload(tmp_path, final_path):
+    try:
+        os.makedirs(os.path.dirname(final_path), exist_ok=True)
+        os.replace(tmp_path, final_path)
+    except BaseException:
+        remove_file(tmp_path)
+        raise
+
+# Stage an upload and move it straight to path_for(sha256). Returns (sha256, size).
+def save_hashed_upload(file, folder, path_for):
+    sha256, size, tmp_path = stage_hashed_upload(file, folder)
+    place_hashed_upload(tmp_path, path_for(sha256))
+    return sha256, size
+
+def remove_file(path):
+    if path and os.path.exists(path):
+        os.remove(path)
+
+# -----------------------------------------------------------------------------
+#                       Profile picture thumbnails
+# -----------------------------------------------------------------------------
+# Originals are saved as <hash>.<ext>; a worker pool then renders square WebP thumbnails
+# named <hash>-<size>.webp next to them. Names change with content, so the files are
+# served with far-future cache headers. Until a thumbnail exists templates fall back to
+# the original.
+default_config['PROFILE_PIC_SIZES'] = {'sm': 64, 'md': 160, 'lg': 320}
+default_config['PROFILE_PIC_QUALITY'] = 80
+default_config['IMAGE_WORKERS'] = 2
+PROFILE_PIC_HASH_LENGTH = 16
+HASHED_PROFILE_PIC = re.compile(r'^[0-9a-f]{%d}(-[a-z]+)?\.[a-z]+$' % PROFILE_PIC_HASH_LENGTH)
+
+image_executor = None
+image_executor_pid = None
+
+# Created on first use in each process, so preforked workers never share a dead pool
+def get_image_executor():
+    global image_executor, image_executor_pid
+    if image_executor is None or image_executor_pid != os.getpid():
+        image_executor = ThreadPoolExecutor(max_workers=current_app.config['IMAGE_WORKERS'], thread_name_prefix='thumbnails')
+        image_executor_pid = os.getpid()
+    return image_executor
+
+def thumbnail_filename(profile_pic, size):
+    return f"{profile_pic.rsplit('.', 1)[0]}-{size}.webp"
+
+# Runs in the thumbnail pool, outside the app context, so it is handed the app's logger
+def render_thumbnails(folder, profile_pic, sizes, quality, logger):
+    from PIL import Image, ImageOps
+    try:
+        with Image.open(os.path.join(folder, profile_pic)) as original:
+            image = ImageOps.exif_transpose(original)
+            image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+            for size, pixels in sizes.items():
+                target = os.path.join(folder, thumbnail_filename(profile_pic, size))
+                if os.path.exists(target):
+                    continue
+                # Write to a temp file of our own first so a half-written thumbnail is never
+                # served; the same image may be rendered by two jobs at once
+                fd, tmp_target = tempfile.mkstemp(dir=folder, prefix='.thumbnail-')
+                try:
+                    with os.fdopen(fd, 'wb') as out:
+                        ImageOps.fit(image, (pixels, pixels), Image.LANCZOS).save(out, 'WEBP', quality=quality)
+                    os.replace(tmp_target, target)
+                finally:
+                    remove_file(tmp_target)
+    except Exception:
+        logger.exception('Could not render thumbnails for %s', profile_pic)
+
+def queue_thumbnails(profile_pic):
+    return get_image_executor().submit(render_thumbnails, current_app.config['UPLOAD_FOLDER'], profile_pic,
+                                       dict(current_app.config['PROFILE_PIC_SIZES']), current_app.config['PROFILE_PIC_QUALITY'],
+                                       current_app.logger)
+
+# Save an uploaded picture under a content-hash name and queue its thumbnails. The
+# extension comes from the name allowed_file() checked; secure_filename() would drop
+# everything before it in a name such as "фото.png", dot included.
+def save_profile_pic(file):
+    extension = file.filename.rsplit('.', 1)[1].lower()
+    folder = current_app.config['UPLOAD_FOLDER']
+    sha256, _ = save_hashed_upload(file, folder, lambda digest: os.path.join(folder, f'{digest[:PROFILE_PIC_HASH_LENGTH]}.{extension}'))
+    profile_pic = f'{sha256[:PROFILE_PIC_HASH_LENGTH]}.{extension}'
+    queue_thumbnails(profile_pic)
+    return profile_pic
+
+# Once the change is committed, remove a picture and its thumbnails unless a profile
+# still uses the same image. The thumbnails are named by content hash alone, so they are
+# shared with the same image saved under another extension.
+def remove_profile_pic(profile_pic):
+    if not profile_pic:
+        return
+    stem = profile_pic.rsplit('.', 1)[0]
+    others = {other for (other,) in db.session.query(Profile.profile_pic).filter(Profile.profile_pic.like(stem + '.%'))}
+    if profile_pic in others:
+        return
+    folder = current_app.config['UPLOAD_FOLDER']
+    remove_file(os.path.join(folder, profile_pic))
+    if others:
+        return
+    for size in current_app.config['PROFILE_PIC_SIZES']:
+        remove_file(os.path.join(folder, thumbnail_filename(profile_pic, size)))
+
+@profile_bp.app_template_global()
+def profile_pic_url(profile_pic, size='md'):
+    thumbnail = thumbnail_filename(profile_pic, size)
+    if os.path.exists(os.path.join(current_app.config['UPLOAD_FOLDER'], thumbnail)):
+        return url_for('static', filename='profile_pics/' + thumbnail)
+    return url_for('static', filename='profile_pics/' + profile_pic)
+
+# Content-hashed profile pictures and built assets never change, so browsers may keep them for a year
+@ops_bp.after_app_request
+def cache_hashed_static_files(response):
+    if request.endpoint == 'static' and response.status_code in (200, 206):
+        filename = request.view_args.get('filename', '')
+        if (filename.startswith('profile_pics/') and HASHED_PROFILE_PIC.match(filename.split('/', 1)[1])) or \
+                is_built_asset(filename):
+            response.cache_control.no_cache = None
+            response.cache_control.public = True
+            response.cache_control.max_age = 31536000
+            response.cache_control.immutable = True
+    return response
+
+@profile_bp.cli.command('build-thumbnails')
+def build_thumbnails():
+    futures = [queue_thumbnails(profile.profile_pic) for profile in Profile.query.filter(Profile.profile_pic.isnot(None))]
+    for future in futures:
+        future.result()
+    print(f'Rendered thumbnails for {len(futures)} profile pictures.')
+
+# -----------------------------------------------------------------------------
+#                       Static asset pipeline
+# -----------------------------------------------------------------------------
+# `flask build-assets` copies static/ into static/dist/ under content-hashed names
+# (styles.css -> styles.3f9a0c1d2e.css), writes .gz and .br copies of text assets and
+# records the mapping in dist/manifest.json. url_for('static', ...) looks names up in the
+# manifest, so templates emit hashed URLs without changes; files missing from it (or no
+# build at all, as in development) keep their plain URLs. Built files are immutable and are
+# served precompressed when the client accepts it. Earlier builds are left in place so pages
+# rendered before a deploy still find their assets.
+default_config['ASSET_BUILD_DIR'] = 'dist'
+default_config['ASSET_SKIP_DIRS'] = {'dist', 'profile_pics', 'uploads', 'resume'}  # user uploads, not assets
+default_config['ASSET_COMPRESS_EXTENSIONS'] = {'.css', '.js', '.svg', '.json', '.txt', '.ico', '.map'}
+ASSET_HASH_LENGTH = 10
+ASSET_ENCODINGS = [('br', '.br'), ('gzip', '.gz')]  # in order of preference
+CSS_URL = re.compile(r'url\(\s*([\'"]?)([^\'")]+)\1\s*\)')
+
+asset_manifest = None
+asset_manifest_mtime = None
+
+def asset_manifest_path():
+    return os.path.join(current_app.static_folder, current_app.config['ASSET_BUILD_DIR'], 'manifest.json')
+
+# Read once per process; in debug mode re-read whenever a rebuild changes the file
+def load_asset_manifest():
+    global asset_manifest, asset_manifest_mtime
+    if asset_manifest is not None and not current_app.debug:
+        return asset_manifest
+    path = asset_manifest_path()
+    try:
+        mtime = os.path.getmtime(path)
+    except OSError:
+        asset_manifest, asset_manifest_mtime = {}, None
+        return asset_manifest
+    if mtime != asset_manifest_mtime:
+        with open(path) as manifest_file:
+            asset_manifest = json.load(manifest_file)
+        asset_manifest_mtime = mtime
+    return asset_manifest
+
+def is_built_asset(filename):
+    build_dir = current_app.config['ASSET_BUILD_DIR']
+    return filename.startswith(build_dir + '/') and filename != f'{build_dir}/manifest.json'
+
+@ops_bp.app_url_defaults
+def hashed_static_url(endpoint, values):
+    if endpoint == 'static' and 'filename' in values:
+        hashed = load_asset_manifest().get(values['filename'])
+        if hashed:
+            values['filename'] = f"{current_app.config['ASSET_BUILD_DIR']}/{hashed}"
+
+def hashed_asset_name(name, content):
+    stem, extension = os.path.splitext(name)
+    return f'{stem}.{hashlib.sha256(content).hexdigest()[:ASSET_HASH_LENGTH]}{extension}'
+
+# Point relative url(...) references in a stylesheet at the hashed copies
+def rewrite_css_urls(css, css_name, manifest):
+    css_dir = os.path.dirname(css_name)
+
+    def replace(match):
+        reference = match.group(2)
+        if re.match(r'^(?:[a-z]+:|/|#)', reference, re.IGNORECASE):
+            return match.group(0)
+        path, _, suffix = reference.partition('?')
+        target = os.path.normpath(os.path.join(css_dir, path)).replace(os.sep, '/')
+        if target not in manifest:
+            return match.group(0)
+        hashed = os.path.relpath(manifest[target], css_dir or '.').replace(os.sep, '/')
+        return f"url({match.group(1)}{hashed}{'?' + suffix if suffix else ''}{match.group(1)})"
+
+    return CSS_URL.sub(replace, css)
+
+def write_asset(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as out:
+        out.write(content)
+    os.replace(tmp_path, path)
+
+# Build static/dist and return the manifest. Stylesheets go last so the images they
+# reference already have hashed names, and a changed image changes the stylesheet's hash.
+def build_assets():
+    import brotli
+    static_folder = current_app.static_folder
+    build_folder = os.path.join(static_folder, current_app.config['ASSET_BUILD_DIR'])
+    sources = []
+    for root, dirs, files in os.walk(static_folder):
+        if root == static_folder:
+            dirs[:] = [name for name in dirs if name not in current_app.config['ASSET_SKIP_DIRS']]
+        for filename in files:
+            name = os.path.relpath(os.path.join(root, filename), static_folder).replace(os.sep, '/')
+            sources.append(name)
+    sources.sort(key=lambda name: (name.endswith('.css'), name))
+
+    manifest = {}
+    compressed = 0
+    for name in sources:
+        with open(os.path.join(static_folder, name), 'rb') as source:
+            content = source.read()
+        if name.endswith('.css'):
+            content = rewrite_css_urls(content.decode('utf-8'), name, manifest).encode('utf-8')
+        manifest[name] = hashed_asset_name(name, content)
+        target = os.path.join(build_folder, manifest[name])
+        if os.path.exists(target):
+            continue  # same content was built before
+        write_asset(target, content)
+        if os.path.splitext(name)[1].lower() in current_app.config['ASSET_COMPRESS_EXTENSIONS']:
+            write_asset(target + '.gz', gzip.compress(content, compresslevel=9, mtime=0))
+            write_asset(target + '.br', brotli.compress(content, quality=11))
+            compressed += 1
+
+    global asset_manifest, asset_manifest_mtime
+    write_asset(asset_manifest_path(), json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+    asset_manifest, asset_manifest_mtime = manifest, os.path.getmtime(asset_manifest_path())
+    return manifest, compressed
+
+@ops_bp.cli.command('build-assets')
+def build_assets_command():
+    manifest, compressed = build_assets()
+    print(f'Fingerprinted {len(manifest)} static files ({compressed} precompressed) into '
+          f"{os.path.join(current_app.static_folder, current_app.config['ASSET_BUILD_DIR'])}.")
+
+# Serve a built asset's .br or .gz copy when the client accepts that encoding
+def send_static_asset(filename):
+    built = is_built_asset(filename)
+    if built:
+        path = os.path.join(current_app.static_folder, filename)
+        for encoding, suffix in ASSET_ENCODINGS:
+            if request.accept_encodings[encoding] and os.path.exists(path + suffix):
+                response = send_from_directory(current_app.static_folder, filename + suffix,
+                                               mimetype=mimetypes.guess_type(filename)[0])
+                response.headers['Content-Encoding'] = encoding
+                response.vary.add('Accept-Encoding')
+                return response
+    response = current_app.send_static_file(filename)
+    if built and os.path.splitext(filename)[1].lower() in current_app.config['ASSET_COMPRESS_EXTENSIONS']:
+        response.vary.add('Accept-Encoding')
+    return response
+
 
 # -----------------------------------------------------------------------------
 
-@app.route('/create_profile', methods=['GET', 'POST'])
+@profile_bp.route('/create_profile', methods=['GET', 'POST'])
 @login_required
 def create_profile():
     if request.method == 'POST':
@@ -254,8 +1064,7 @@ def create_profile():
         # Handle file upload
         file = request.files['profile_pic']
         if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+            filename = save_profile_pic(file)
         else:
             filename = None  # Default profile picture if none is uploaded
 
@@ -266,7 +1075,7 @@ def create_profile():
             db.session.add(profile)
             db.session.commit()
             flash('Profile created successfully!', 'success')
-            return redirect(url_for('studentDashboard'))
+            return redirect(url_for('student.studentDashboard'))
         elif current_user.role == 'company':
             # If the user is a company, create a company-specific profile (optional)
             # You can add more fields specific to the company profile if needed.
@@ -274,16 +1083,16 @@ def create_profile():
             db.session.add(profile)
             db.session.commit()
             flash('Company profile created successfully!', 'success')
-            return redirect(url_for('companyDashboard'))
+            return redirect(url_for('company.companyDashboard'))
         else:
             flash('Invalid role', 'danger')
-            return redirect(url_for('home'))  # Redirect to a safe place like home page
+            return redirect(url_for('auth.index'))  # Redirect to a safe place like home page
         
     return render_template('create_profile.html')
 
 # ------------------------------------------------------------------------------------
 
-@app.route('/update_profile', methods=['GET', 'POST'])
+@profile_bp.route('/update_profile', methods=['GET', 'POST'])
 @login_required
 def update_profile():
     # Retrieve the current user's profile
@@ -292,7 +1101,7 @@ def update_profile():
     # Ensure the user has a profile before proceeding
     if not profile:
         flash('Profile not found.', 'danger')
-        return redirect(url_for('studentDashboard'))
+        return redirect(url_for('student.studentDashboard'))
 
     if request.method == 'POST':
         profile.full_name = request.form['full_name']
@@ -300,29 +1109,31 @@ def update_profile():
         
         # Handle file upload for profile picture update
         file = request.files['profile_pic']
+        old_profile_pic = None
         if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            file.save(os.path.join(app.config['UPLOAD_FOLDER'], filename))
-            profile.profile_pic = filename  # Update the profile picture
+            old_profile_pic = profile.profile_pic
+            profile.profile_pic = save_profile_pic(file)  # Update the profile picture
 
         # Commit the changes to the database
         db.session.commit()
+        if old_profile_pic and old_profile_pic != profile.profile_pic:
+            remove_profile_pic(old_profile_pic)
 
         # Handle different behaviors based on the role
         if current_user.role == 'student':
             flash('Profile updated successfully!', 'success')
-            return redirect(url_for('studentDashboard'))
+            return redirect(url_for('student.studentDashboard'))
         elif current_user.role == 'company':
             flash('Company profile updated successfully!', 'success')
-            return redirect(url_for('companyDashboard'))
+            return redirect(url_for('company.companyDashboard'))
         else:
             flash('Invalid role', 'danger')
-            return redirect(url_for('home'))  # Redirect to home if the role is invalid
+            return redirect(url_for('auth.index'))  # Redirect to home if the role is invalid
 
     return render_template('update_profile.html', profile=profile)
 
 # ------------------------------------------------------------------------------------
-@app.route('/delete_profile', methods=['POST'])
+@profile_bp.route('/delete_profile', methods=['POST'])
 @login_required
 def delete_profile():
     # Retrieve the profile of the currently logged-in user
@@ -330,204 +1141,540 @@ def delete_profile():
 
     # If profile exists, proceed with deletion
     if profile:
-        # Optionally, delete the profile picture from the server
-        if profile.profile_pic:
-            os.remove(os.path.join(app.config['UPLOAD_FOLDER'], profile.profile_pic))
-        
+        profile_pic = profile.profile_pic
+
         # Delete the profile from the database
         db.session.delete(profile)
         db.session.commit()
 
+        # Then the picture and its thumbnails, unless another profile shares them
+        remove_profile_pic(profile_pic)
+
         # Role-based logic for redirection and flash message
         if current_user.role == 'student':
             flash('Profile deleted successfully!', 'info')
-            return redirect(url_for('studentDashboard'))
+            return redirect(url_for('student.studentDashboard'))
         elif current_user.role == 'company':
             flash('Company profile deleted successfully!', 'info')
-            return redirect(url_for('companyDashboard'))
+            return redirect(url_for('company.companyDashboard'))
         else:
             flash('Invalid role', 'danger')
-            return redirect(url_for('home'))  # Redirect to home if the role is invalid
+            return redirect(url_for('auth.index'))  # Redirect to home if the role is invalid
 
     # If no profile is found for the user, handle it gracefully
     flash('No profile found to delete.', 'danger')
-    return redirect(url_for('home'))  # Or redirect to a specific dashboard
+    return redirect(url_for('auth.index'))  # Or redirect to a specific dashboard
 
 # ================================resume===================================================
 
+# One stored file per distinct resume content, shared by every Resume row that uploaded it
+class ResumeBlob(db.Model):
+    sha256 = db.Column(db.String(64), primary_key=True)
+    size = db.Column(db.Integer, nullable=False)
+    ref_count = db.Column(db.Integer, nullable=False, default=0)
+    created_at = db.Column(db.DateTime, default=db.func.current_timestamp())
+
 class Resume(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     filename = db.Column(db.String(120), nullable=False)  # Resume file name
+    blob_hash = db.Column(db.String(64), db.ForeignKey('resume_blob.sha256'), nullable=True)  # None for files saved before blob storage
     uploaded_at = db.Column(db.DateTime, default=db.func.current_timestamp())  # Timestamp for upload
 
     user = db.relationship('User', backref=db.backref('resumes', lazy=True))  # Many-to-one relationship
 
 # app.config['RESUME_UPLOAD_FOLDER'] = 'uploads/resumes'
-app.config['RESUME_UPLOAD_FOLDER'] = os.path.join('static', 'uploads', 'resumes')
+default_config['RESUME_UPLOAD_FOLDER'] = os.path.join('static', 'uploads', 'resumes')
 
-app.config['ALLOWED_RESUME_EXTENSIONS'] = {'pdf', 'doc', 'docx'}
-
-# Ensure the folder exists
-import os
-if not os.path.exists(app.config['RESUME_UPLOAD_FOLDER']):
-    os.makedirs(app.config['RESUME_UPLOAD_FOLDER'])
+default_config['ALLOWED_RESUME_EXTENSIONS'] = {'pdf', 'doc', 'docx'}
 
 def allowed_resume_file(filename):
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in app.config['ALLOWED_RESUME_EXTENSIONS']
+    return '.' in filename and filename.rsplit('.', 1)[1].lower() in current_app.config['ALLOWED_RESUME_EXTENSIONS']
+
+# ------------------------------------------------------------------------------------------
+#                       Dashboard loader
+# ------------------------------------------------------------------------------------------
+# A dashboard reads the user's profile, student details and resumes in one SELECT with
+# joined eager loads, instead of one lazy load per relationship the template touches.
+# The result (plus the student's recommendations) is cached per user for a short while
+# as plain snapshots, like the identity cache. Writes to those rows drop the entry at
+# flush and again after commit; applying for a vacancy drops it too, since it changes
+# the recommendations. That only reaches this process's cache, so the writer's session
+# also skips the cache until entries other workers cached before the write have expired.
+default_config['DASHBOARD_CACHE_SIZE'] = 10000
+default_config['DASHBOARD_CACHE_TTL'] = 30  # seconds
+
+PROFILE_SNAPSHOT_COLUMNS = ('full_name', 'bio', 'profile_pic')
+DETAILS_SNAPSHOT_COLUMNS = ('education', 'skills', 'contact', 'address')
+RESUME_SNAPSHOT_COLUMNS = ('id', 'filename', 'uploaded_at')
+VACANCY_SNAPSHOT_COLUMNS = ('id', 'title', 'location')
+
+def snapshot(obj, columns):
+    return None if obj is None else {column: getattr(obj, column) for column in columns}
+
+def load_dashboard(user):
+    if session.get('dashboard_fresh_until', 0) < time.time():
+        dashboard = app_cache('dashboard').get(user.id)
+        if dashboard is not None:
+            return dashboard
+
+    with sql_scope('load_dashboard'):
+        options = [db.joinedload(User.profile)]
+        if user.role == 'student':
+            options += [db.joinedload(User.student_details), db.joinedload(User.resumes)]
+        loaded = db.session.execute(db.select(User).where(User.id == user.id).options(*options)).unique().scalar_one()
+        dashboard = {'profile': snapshot(loaded.profile, PROFILE_SNAPSHOT_COLUMNS)}
+        if user.role == 'student':
+            recommendations = recommend_vacancies(user.id, current_app.config['RECOMMENDATIONS_LIMIT'])
+            dashboard.update(
+                details=snapshot(loaded.student_details, DETAILS_SNAPSHOT_COLUMNS),
+                resumes=[snapshot(resume, RESUME_SNAPSHOT_COLUMNS) for resume in sorted(loaded.resumes, key=lambda resume: resume.id)],
+                recommendations=[(snapshot(vacancy, VACANCY_SNAPSHOT_COLUMNS), matched) for vacancy, matched in recommendations],
+            )
+    app_cache('dashboard').set(user.id, dashboard)
+    return dashboard
+
+def forget_dashboard(user_id, db_session=None):
+    app_cache('dashboard').invalidate(user_id)
+    if db_session is not None:
+        db_session.info.setdefault('changed_dashboard_ids', set()).add(user_id)
+
+@event.listens_for(Profile, 'after_insert')
+@event.listens_for(Profile, 'after_update')
+@event.listens_for(Profile, 'after_delete')
+@event.listens_for(StudentDetails, 'after_insert')
+@event.listens_for(StudentDetails, 'after_update')
+@event.listens_for(StudentDetails, 'after_delete')
+@event.listens_for(Resume, 'after_insert')
+@event.listens_for(Resume, 'after_update')
+@event.listens_for(Resume, 'after_delete')
+def invalidate_dashboard(mapper, connection, target):
+    forget_dashboard(target.user_id, object_session(target))
+
+@event.listens_for(Session, 'after_commit')
+def invalidate_committed_dashboards(db_session):
+    for user_id in db_session.info.pop('changed_dashboard_ids', ()):
+        app_cache('dashboard').invalidate(user_id)
+        if has_request_context():
+            g.setdefault('changed_dashboard_ids', set()).add(user_id)
+
+@event.listens_for(Session, 'after_rollback')
+def forget_rolled_back_dashboards(db_session):
+    db_session.info.pop('changed_dashboard_ids', None)
+
+# The redirect after a write may land on another worker that still holds the old entry
+@ops_bp.after_app_request
+def skip_stale_dashboards(response):
+    changed = g.get('changed_dashboard_ids')
+    if changed and current_user.is_authenticated and current_user.id in changed:
+        session['dashboard_fresh_until'] = time.time() + current_app.config['DASHBOARD_CACHE_TTL']
+    return response
+
+# ------------------------------------------------------------------------------------------
+# Content-addressed resume storage: files live at RESUME_BLOB_FOLDER/<ab>/<sha256> outside
+# static/, identical uploads share one file, and ResumeBlob.ref_count decides when it goes.
+default_config['RESUME_BLOB_FOLDER'] = os.path.join('uploads', 'resume_blobs')
+
+def blob_path(sha256):
+    return os.path.join(current_app.config['RESUME_BLOB_FOLDER'], sha256[:2], sha256)
+
+def resume_path(resume):
+    if resume.blob_hash:
+        return blob_path(resume.blob_hash)
+    return os.path.join(current_app.config['RESUME_UPLOAD_FOLDER'], resume.filename)
+
+# Store an upload by content hash and add a reference to its blob. The file goes into place
+# only after the reference: the upsert waits for any delete of the blob row that is still
+# in flight, so a deleting request (see commit_releasing_file) is done with the old copy by
+# then. The caller commits the session.
+def store_resume_blob(file):
+    sha256, size, tmp_path = stage_hashed_upload(file, current_app.config['RESUME_BLOB_FOLDER'])
+    try:
+        add_blob_reference(sha256, size)
+    except BaseException:
+        remove_file(tmp_path)
+        raise
+    place_hashed_upload(tmp_path, blob_path(sha256))
+    return sha256
+
+# Create the blob row or bump its ref_count in one upsert, so two first uploads of the same
+# file cannot both INSERT. It locks the row for writing straight away: INSERT IGNORE plus
+# UPDATE would share-lock an existing row on InnoDB, and two uploads upgrading that lock
+# deadlock.
+def add_blob_reference(sha256, size):
+    values = {'sha256': sha256, 'size': size, 'ref_count': 1}
+    insert = dialect_insert(ResumeBlob)
+    if insert is not None and db.engine.dialect.name == 'mysql':
+        insert = insert.values(values)
+        db.session.execute(insert.on_duplicate_key_update(ref_count=insert.table.c.ref_count + 1))
+    elif insert is not None:
+        db.session.execute(insert.values(values).on_conflict_do_update(
+            index_elements=['sha256'], set_={'ref_count': ResumeBlob.ref_count + 1}))
+    else:
+        try:
+            with db.session.begin_nested():
+                db.session.execute(db.insert(ResumeBlob).values(values))
+        except IntegrityError:
+            db.session.execute(db.update(ResumeBlob).where(ResumeBlob.sha256 == sha256).values(ref_count=ResumeBlob.ref_count + 1))
+
+# Drop one reference to a resume's file. Returns the path to unlink once the session has
+# committed, or None while other resumes still point at the blob.
+def release_resume_file(resume):
+    if not resume.blob_hash:
+        return os.path.join(current_app.config['RESUME_UPLOAD_FOLDER'], resume.filename)
+
+    db.session.execute(
+        db.update(ResumeBlob).where(ResumeBlob.sha256 == resume.blob_hash).values(ref_count=ResumeBlob.ref_count - 1)
+    )
+    deleted = db.session.execute(
+        db.delete(ResumeBlob).where(ResumeBlob.sha256 == resume.blob_hash, ResumeBlob.ref_count <= 0)
+    ).rowcount
+    return blob_path(resume.blob_hash) if deleted else None
+
+# Commit a session in which release_resume_file gave up `path`, then unlink it. The file is
+# moved aside before the commit, while our delete still locks the blob row, so an upload
+# of the same content that is waiting on that lock places its own copy afterwards instead
+# of having it removed. It is put back if the commit fails.
+def commit_releasing_file(path):
+    aside = None
+    if path and os.path.exists(path):
+        aside = path + '.released'
+        os.replace(path, aside)
+    try:
+        db.session.commit()
+    except BaseException:
+        if aside:
+            os.replace(aside, path)
+        raise
+    remove_file(aside)
+
+# ------------------------------------------------------------------------------------------
+# Resume downloads. By default Python streams the file with strong ETags (the blob hash),
+# conditional GET and Range support. In a proxy mode the response only carries headers and
+# the front proxy sends the bytes: 'x-sendfile' (Apache/lighttpd) passes the absolute path,
+# 'x-accel-redirect' (nginx) passes RESUME_ACCEL_REDIRECT_PREFIX + '<ab>/<sha256>', which
+# should be an internal location aliased to RESUME_BLOB_FOLDER.
+default_config['RESUME_SENDFILE_MODE'] = None  # None, 'x-sendfile' or 'x-accel-redirect'
+default_config['RESUME_ACCEL_REDIRECT_PREFIX'] = '/protected/resumes/'
+
+# Students see their own resumes; companies see resumes of students who applied to them
+def can_view_resume(resume):
+    if current_user.role == 'student':
+        return resume.user_id == current_user.id
+    if current_user.role == 'company':
+        applied = (Application.query
+                   .join(Application.vacancy)
+                   .filter(Application.student_id == resume.user_id, Vacancy.company_id == current_user.id)
+                   .exists())
+        return db.session.query(applied).scalar()
+    return False
+
+def offload_resume(resume, path, mode):
+    response = current_app.response_class(mimetype=mimetypes.guess_type(resume.filename)[0] or 'application/octet-stream')
+    if mode == 'x-accel-redirect':
+        response.headers['X-Accel-Redirect'] = current_app.config['RESUME_ACCEL_REDIRECT_PREFIX'] + resume.blob_hash[:2] + '/' + resume.blob_hash
+    else:
+        response.headers['X-Sendfile'] = path
+    response.headers.set('Content-Disposition', 'inline', filename=resume.filename)
+    response.set_etag(resume.blob_hash)
+    response.last_modified = os.path.getmtime(path)
 
+    # 304s are answered here; Range requests are left to the proxy
+    response = response.make_conditional(request)
+    if response.status_code == 304:
+        response.headers.pop('X-Accel-Redirect', None)
+        response.headers.pop('X-Sendfile', None)
+    return response
 
-@app.route('/upload_resume', methods=['GET', 'POST'])
+
+@resume_bp.route('/upload_resume', methods=['GET', 'POST'])
 @login_required
 def upload_resume():
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     if request.method == 'POST':
         file = request.files['resume']
         if file and allowed_resume_file(file.filename):
             filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['RESUME_UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            blob_hash = store_resume_blob(file)
 
             # Save resume record to database
-            resume = Resume(user_id=current_user.id, filename=filename)
+            resume = Resume(user_id=current_user.id, filename=filename, blob_hash=blob_hash)
             db.session.add(resume)
             db.session.commit()
+            queue_resume_extraction(resume)
 
             flash('Resume uploaded successfully!', 'success')
-            return redirect(url_for('studentDashboard'))
+            return redirect(url_for('student.studentDashboard'))
         else:
             flash('Invalid file type. Only PDF, DOC, and DOCX are allowed.', 'danger')
 
     return render_template('upload_resume.html')
 
-@app.route('/view_resumes')
+@resume_bp.route('/view_resumes')
+@read_replica
 @login_required
 def view_resumes():
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     resumes = Resume.query.filter_by(user_id=current_user.id).all()
     return render_template('view_resumes.html', resumes=resumes)
 
-@app.route('/update_resume/<int:resume_id>', methods=['GET', 'POST'])
+@resume_bp.route('/update_resume/<int:resume_id>', methods=['GET', 'POST'])
 @login_required
 def update_resume(resume_id):
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     resume = Resume.query.get_or_404(resume_id)
     if resume.user_id != current_user.id:
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     if request.method == 'POST':
         file = request.files['resume']
         if file and allowed_resume_file(file.filename):
-            # Remove old resume file
-            old_filepath = os.path.join(app.config['RESUME_UPLOAD_FOLDER'], resume.filename)
-            if os.path.exists(old_filepath):
-                os.remove(old_filepath)
-
-            # Save new resume file
-            filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config['RESUME_UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            # Store the new file first so re-uploading identical content keeps its blob alive
+            blob_hash = store_resume_blob(file)
+            orphan_path = release_resume_file(resume)
 
             # Update resume record
-            resume.filename = filename
-            db.session.commit()
+            resume.filename = secure_filename(file.filename)
+            resume.blob_hash = blob_hash
+            commit_releasing_file(orphan_path)
+            queue_resume_extraction(resume)
 
             flash('Resume updated successfully!', 'success')
-            return redirect(url_for('studentDashboard'))
+            return redirect(url_for('student.studentDashboard'))
         else:
             flash('Invalid file type. Only PDF, DOC, and DOCX are allowed.', 'danger')
 
     return render_template('update_resume.html', resume=resume)
 
-@app.route('/delete_resume/<int:resume_id>', methods=['POST'])
+@resume_bp.route('/delete_resume/<int:resume_id>', methods=['POST'])
 @login_required
 def delete_resume(resume_id):
     if current_user.role != 'student':
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     resume = Resume.query.get_or_404(resume_id)
     if resume.user_id != current_user.id:
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
-
-    # Remove the file from the filesystem
-    filepath = os.path.join(app.config['RESUME_UPLOAD_FOLDER'], resume.filename)
-    if os.path.exists(filepath):
-        os.remove(filepath)
+        return redirect(url_for('auth.index'))
 
-    # Delete the record from the database
+    # Delete the record from the database, then the file if no other resume shares it
+    orphan_path = release_resume_file(resume)
+    remove_resume_text(resume.id)
     db.session.delete(resume)
-    db.session.commit()
+    commit_releasing_file(orphan_path)
     flash('Resume deleted successfully!', 'info')
 
-    return redirect(url_for('studentDashboard'))
+    return redirect(url_for('student.studentDashboard'))
 
-@app.route('/uploads/resumes/<filename>')
+@resume_bp.route('/resumes/<int:resume_id>')
 @login_required
-def serve_resume(filename):
-    if current_user.role != 'student':
+def serve_resume(resume_id):
+    resume = Resume.query.get_or_404(resume_id)
+    if not can_view_resume(resume):
         flash("Access Denied!", "danger")
-        return redirect(url_for('index'))
-    
-    # Return the requested file from the uploads/resumes folder
-    return send_from_directory(app.config['RESUME_UPLOAD_FOLDER'], filename)
+        return redirect(url_for('auth.index'))
+
+    path = os.path.abspath(resume_path(resume))
+    if not os.path.exists(path):
+        abort(404)
+
+    mode = current_app.config['RESUME_SENDFILE_MODE']
+    if resume.blob_hash and mode:
+        response = offload_resume(resume, path, mode)
+    else:
+        # Blobs are stored without an extension, so the download name carries the type.
+        # Legacy files fall back to Werkzeug's mtime/size based ETag.
+        response = send_file(path, download_name=resume.filename, etag=resume.blob_hash or True, conditional=True)
+
+    # Browsers may keep a copy but must revalidate, which costs a 304 when nothing changed
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
 
 # ====================vacancies==============================================
 
 class Vacancy(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    company_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    company_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False, index=True)
     title = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
     location = db.Column(db.String(100), nullable=False)
     posted_date = db.Column(db.DateTime, default=datetime.utcnow)
     last_date = db.Column(db.DateTime, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)  # part of the card cache key
 
     company = db.relationship('User', backref='vacancies')  # Assuming 'User' is the company model
 
+    # Composite indexes for the keyset-paginated student listing: rows come out of the
+    # index already ordered by (posted_date, id), and last_date rides along so the
+    # "still open" filter is checked without touching the table row.
+    __table_args__ = (
+        db.Index('ix_vacancy_posted_date_id', 'posted_date', 'id', 'last_date'),
+        db.Index('ix_vacancy_location_posted_date_id', 'location', 'posted_date', 'id', 'last_date'),
+        db.Index('ix_vacancy_last_date', 'last_date'),  # expiry scans by the archive job
+    )
+
 class Application(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     student_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
-    vacancy_id = db.Column(db.Integer, db.ForeignKey('vacancy.id'), nullable=False)
+    vacancy_id = db.Column(db.Integer, db.ForeignKey('vacancy.id'), nullable=False, index=True)
     status = db.Column(db.String(20), default='Pending')  # 'Pending', 'Selected', 'Rejected'
     applied_date = db.Column(db.DateTime, default=datetime.utcnow)
 
     student = db.relationship('User', backref='applications', foreign_keys=[student_id])  # Assuming 'User' is the student model
     vacancy = db.relationship('Vacancy', backref='applications', foreign_keys=[vacancy_id])
 
+    # A student can apply to a vacancy once; the index also serves the duplicate lookup
+    # and every student_id lookup, so student_id needs no index of its own
+    __table_args__ = (
+        db.UniqueConstraint('student_id', 'vacancy_id', name='uq_application_student_vacancy'),
+    )
+
+# Insert a Pending application in a single statement. A duplicate (student_id,
+# vacancy_id) is a no-op thanks to the unique index, so concurrent double-clicks
+# cannot create two rows. Returns True if a row was inserted.
+def insert_application(student_id, vacancy_id):
+    values = {'student_id': student_id, 'vacancy_id': vacancy_id, 'status': 'Pending', 'applied_date': datetime.utcnow()}
+    insert = dialect_insert(Application)
+    if insert is not None and db.engine.dialect.name == 'mysql':
+        return db.session.execute(insert.values(values).prefix_with('IGNORE')).rowcount == 1
+    if insert is not None:
+        return db.session.execute(insert.values(values).on_conflict_do_nothing(index_elements=['student_id', 'vacancy_id'])).rowcount == 1
+    try:
+        with db.session.begin_nested():
+            db.session.execute(db.insert(Application).values(values))
+        return True
+    except IntegrityError:
+        return False
+
+# Denormalized application counters, one row per vacancy, so company dashboards read
+# O(vacancies) rows instead of counting applications. Kept in step in the same
+# transaction as every application write; reconcile_application_stats() repairs drift.
+class VacancyApplicationStats(db.Model):
+    vacancy_id = db.Column(db.Integer, db.ForeignKey('vacancy.id'), primary_key=True)
+    total = db.Column(db.Integer, nullable=False, default=0)
+    pending = db.Column(db.Integer, nullable=False, default=0)
+    selected = db.Column(db.Integer, nullable=False, default=0)
+    rejected = db.Column(db.Integer, nullable=False, default=0)
+
+    vacancy = db.relationship('Vacancy', backref=db.backref('application_stats', uselist=False))
+
+# Application.status -> counter column; other statuses only count towards the total
+STATUS_COUNTERS = {'Pending': 'pending', 'Selected': 'selected', 'Rejected': 'rejected'}
+STATS_RECONCILE_CHUNK = 1000
+
+def create_application_stats(vacancy_ids):
+    if vacancy_ids:
+        db.session.execute(db.insert(VacancyApplicationStats), [{'vacancy_id': vacancy_id} for vacancy_id in vacancy_ids])
+
+# Fresh counts for the given vacancies straight from the application table
+def count_applications(vacancy_ids):
+    columns = [db.func.count(Application.id)] + [
+        db.func.coalesce(db.func.sum(db.case((Application.status == status, 1), else_=0)), 0)
+        for status in STATUS_COUNTERS
+    ]
+    counts = {vacancy_id: (0,) * len(columns) for vacancy_id in vacancy_ids}
+    rows = (db.session.query(Application.vacancy_id, *columns)
+            .filter(Application.vacancy_id.in_(vacancy_ids))
+            .group_by(Application.vacancy_id))
+    for vacancy_id, *values in rows:
+        counts[vacancy_id] = tuple(values)
+    return {
+        vacancy_id: dict(zip(['total'] + list(STATUS_COUNTERS.values()), values))
+        for vacancy_id, values in counts.items()
+    }
+
+# Apply a delta to one vacancy's counters, e.g. {'total': 1, 'pending': 1}. A vacancy
+# without a stats row (created before counters existed) gets one counted from scratch.
+def adjust_application_stats(vacancy_id, delta):
+    delta = {column: amount for column, amount in delta.items() if amount}
+    if not delta:
+        return
+    updated = db.session.execute(
+        db.update(VacancyApplicationStats)
+        .where(VacancyApplicationStats.vacancy_id == vacancy_id)
+        .values({column: getattr(VacancyApplicationStats, column) + amount for column, amount in delta.items()})
+    ).rowcount
+    if not updated:
+        db.session.flush()  # make the caller's pending application visible to the count
+        db.session.add(VacancyApplicationStats(vacancy_id=vacancy_id, **count_applications([vacancy_id])[vacancy_id]))
+
+def status_change_delta(old_status, new_status):
+    delta = {}
+    if old_status in STATUS_COUNTERS:
+        delta[STATUS_COUNTERS[old_status]] = -1
+    if new_status in STATUS_COUNTERS:
+        column = STATUS_COUNTERS[new_status]
+        delta[column] = delta.get(column, 0) + 1
+    return delta
+
+# Recount every vacancy in chunks of STATS_RECONCILE_CHUNK ids and fix rows that drifted.
+# Returns the number of vacancies whose counters were wrong or missing.
+def reconcile_application_stats():
+    drifted = 0
+    last_id = 0
+    while True:
+        vacancy_ids = [row[0] for row in db.session.query(Vacancy.id)
+                       .filter(Vacancy.id > last_id).order_by(Vacancy.id).limit(STATS_RECONCILE_CHUNK)]
+        if not vacancy_ids:
+            break
+        last_id = vacancy_ids[-1]
+
+        fresh = count_applications(vacancy_ids)
+        stored = {stats.vacancy_id: stats for stats in VacancyApplicationStats.query.filter(VacancyApplicationStats.vacancy_id.in_(vacancy_ids))}
+        for vacancy_id, counts in fresh.items():
+            stats = stored.get(vacancy_id)
+            if stats is None:
+                db.session.add(VacancyApplicationStats(vacancy_id=vacancy_id, **counts))
+                drifted += 1
+            elif any(getattr(stats, column) != value for column, value in counts.items()):
+                for column, value in counts.items():
+                    setattr(stats, column, value)
+                drifted += 1
+        db.session.commit()
+    return drifted
+
+@vacancy_bp.cli.command('reconcile-application-stats')
+def reconcile_application_stats_command():
+    drifted = reconcile_application_stats()
+    print(f'Application counters reconciled; {drifted} vacancies were out of date.')
+
 # -------------for cmp--------------------
 
 # company can see created vacancies by itself 
-@app.route('/company/vacancies')
+@vacancy_bp.route('/company/vacancies')
 @login_required
 def view_company_vacancies():
     if current_user.role != 'company':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
-    # Fetch vacancies created by the logged-in company
-    vacancies = Vacancy.query.filter_by(company_id=current_user.id).all()
+    # Fetch vacancies created by the logged-in company together with their counters
+    vacancies = (Vacancy.query
+                 .filter_by(company_id=current_user.id)
+                 .options(db.joinedload(Vacancy.application_stats))
+                 .all())
     return render_template('view_company_vacancies.html', vacancies=vacancies)
 
 # ------------------------------------------------------------------------
 
-@app.route('/company/create_vacancy', methods=['GET', 'POST'])
+@vacancy_bp.route('/company/create_vacancy', methods=['GET', 'POST'])
 @login_required
 def create_vacancy():
     if current_user.role != 'company':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     if request.method == 'POST':
         title = request.form['title']
@@ -544,132 +1691,1648 @@ def create_vacancy():
             last_date=datetime.strptime(last_date, '%Y-%m-%d')
         )
         db.session.add(vacancy)
+        db.session.flush()  # assigns vacancy.id so the index rows can reference it
+        vacancy_search().index_vacancy(db.session, vacancy)
+        index_vacancy_skills([{'id': vacancy.id, 'title': vacancy.title, 'description': vacancy.description}])
+        create_application_stats([vacancy.id])
         db.session.commit()
+
+        # Write-through: the card is ready before the first student asks for it
+        app_cache('fragment').set(vacancy_card_key(vacancy), render_vacancy_card(vacancy))
         flash('Vacancy created successfully!', 'success')
-        return redirect(url_for('companyDashboard'))
+        return redirect(url_for('company.companyDashboard'))
 
     return render_template('create_vacancy.html')
 
 # --------------------------------------------------------------
+# Bulk vacancy import for recruiting partners. The body is read line by line as CSV
+# (text/csv, with a header row) or JSON Lines (application/x-ndjson, one object per line),
+# valid rows are inserted in executemany batches with one commit per batch, and every
+# rejected row is reported back with its row number.
+default_config['IMPORT_BATCH_SIZE'] = 500
+default_config['IMPORT_MAX_REPORTED_ERRORS'] = 1000
+
+def parse_last_date(value):
+    value = value.strip()
+    try:
+        return datetime.strptime(value, '%Y-%m-%d')
+    except ValueError:
+        parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        # stored naive in UTC, like every other timestamp
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+# Returns (row, errors) for one raw record
+def validate_vacancy_row(record, now):
+    errors = []
+    if not isinstance(record, dict):
+        return None, ['row must be a JSON object']
+
+    row = {}
+    for field in ('title', 'description', 'location'):
+        value = record.get(field)
+        value = value.strip() if isinstance(value, str) else ''
+        if not value:
+            errors.append(f'{field} is required')
+        row[field] = value
+    for field, limit in (('title', 100), ('location', 100)):
+        if len(row[field]) > limit:
+            errors.append(f'{field} must be at most {limit} characters')
+
+    last_date = record.get('last_date')
+    if not isinstance(last_date, str) or not last_date.strip():
+        errors.append('last_date is required')
+    else:
+        try:
+            row['last_date'] = parse_last_date(last_date)
+            if row['last_date'] < now:
+                errors.append('last_date is in the past')
+        except ValueError:
+            errors.append('last_date must be YYYY-MM-DD')
+    return row, errors
+
+class ImportNotUTF8(Exception):
+    def __init__(self, row):
+        super().__init__(row)
+        self.row = row
+
+# The body is decoded a chunk at a time, so a bad byte is reported at the first row not
+# yet read, which may be a little before the row that holds it
+def read_import_records(stream, content_type):
+    text_stream = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    number = 0
+    try:
+        if content_type == 'text/csv':
+            for number, record in enumerate(csv.DictReader(text_stream), start=1):
+                yield number, record
+        else:
+            for number, line in enumerate(text_stream, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield number, json.loads(line)
+                except ValueError:
+                    yield number, None
+    except UnicodeDecodeError:
+        raise ImportNotUTF8(number + 1) from None
+
+# Shared by the import endpoint and the benchmark: inserts valid records for company_id
+def import_vacancies(company_id, records):
+    batch_size = current_app.config['IMPORT_BATCH_SIZE']
+    max_errors = current_app.config['IMPORT_MAX_REPORTED_ERRORS']
+    search = vacancy_search()
+    now = datetime.utcnow()
+    inserted = 0
+    error_count = 0
+    errors = []
+    batch = []
+
+    def flush_batch():
+        # The indexes need the new ids: one executemany ... RETURNING where the driver
+        # supports it (SQLite, PostgreSQL), otherwise an ORM flush (MySQL)
+        if db.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            insert = db.insert(Vacancy).returning(Vacancy.id, sort_by_parameter_order=True)
+            ids = db.session.execute(insert, batch).scalars().all()
+        else:
+            vacancies = [Vacancy(**row) for row in batch]
+            db.session.add_all(vacancies)
+            db.session.flush()
+            ids = [vacancy.id for vacancy in vacancies]
+        rows = [dict(row, id=vacancy_id) for row, vacancy_id in zip(batch, ids)]
+        search.index_vacancies(db.session, rows)
+        index_vacancy_skills(rows)
+        create_application_stats(ids)
+        db.session.commit()
 
-@app.route('/company/delete_vacancy/<int:vacancy_id>', methods=['POST'])
+    # Rows before a body that stops being valid UTF-8 are still inserted, as earlier
+    # batches have been committed already; the result then carries an `error`
+    result = {}
+    try:
+        for number, record in records:
+            row, row_errors = validate_vacancy_row(record, now)
+            if row_errors:
+                error_count += 1
+                if len(errors) < max_errors:
+                    errors.append({'row': number, 'errors': row_errors})
+                continue
+            row.update(company_id=company_id, posted_date=now)
+            batch.append(row)
+            if len(batch) >= batch_size:
+                flush_batch()
+                inserted += len(batch)
+                batch = []
+    except ImportNotUTF8 as exc:
+        result['error'] = f'The body is not valid UTF-8 (reading row {exc.row}); nothing after it was imported.'
+    if batch:
+        flush_batch()
+        inserted += len(batch)
+
+    result.update(inserted=inserted, error_count=error_count, errors=errors)
+    return result
+
+@vacancy_bp.route('/company/vacancies/import', methods=['POST'])
+@login_required
+def import_vacancies_view():
+    if current_user.role != 'company':
+        return jsonify(error='Access denied!'), 403
+
+    content_type = request.mimetype
+    if content_type not in ('text/csv', 'application/x-ndjson', 'application/jsonl'):
+        return jsonify(error='Send text/csv or application/x-ndjson.'), 415
+
+    result = import_vacancies(current_user.id, read_import_records(request.stream, content_type))
+    return jsonify(result), 400 if 'error' in result else 200
+
+# --------------------------------------------------------------
+
+@vacancy_bp.route('/company/delete_vacancy/<int:vacancy_id>', methods=['POST'])
 @login_required
 def delete_vacancy(vacancy_id):
     if current_user.role != 'company':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     vacancy = Vacancy.query.get_or_404(vacancy_id)
 
     # Ensure the logged-in company is the one who created this vacancy
     if vacancy.company_id != current_user.id:
         flash('You cannot delete this vacancy. It does not belong to your company.', 'danger')
-        return redirect(url_for('view_company_vacancies'))
+        return redirect(url_for('vacancy.view_company_vacancies'))
 
     # Delete all applications related to this vacancy
     applications = Application.query.filter_by(vacancy_id=vacancy_id).all()
     for application in applications:
         db.session.delete(application)
     
-    # Now delete the vacancy
+    # Now delete the vacancy, its cached card and its search and skill index entries
+    app_cache('fragment').delete(vacancy_card_key(vacancy))
+    vacancy_search().remove_vacancy(db.session, vacancy.id)
+    remove_vacancy_skills(vacancy.id)
+    db.session.execute(db.delete(VacancyApplicationStats).where(VacancyApplicationStats.vacancy_id == vacancy.id))
     db.session.delete(vacancy)
     db.session.commit()
 
     flash('Vacancy deleted successfully!', 'success')
-    return redirect(url_for('view_company_vacancies'))
-
+    return redirect(url_for('vacancy.view_company_vacancies'))
+
+
+# ==================== vacancy card cache ==============================================
+# Vacancy cards are rendered once and reused from a fragment cache keyed on the vacancy
+# id and updated_at, so an edit changes the key and stale cards are never served. The
+# first tier is an in-process LRU; FRAGMENT_CACHE_DIR adds a tier shared by every worker
+# on the host (a local stand-in for memcached/Redis). Per-user bits such as "already
+# applied" are added around the cached cards in the page template.
+default_config['FRAGMENT_CACHE_SIZE'] = 5000
+default_config['FRAGMENT_CACHE_TTL'] = 3600  # seconds
+default_config['FRAGMENT_CACHE_DIR'] = os.environ.get('FRAGMENT_CACHE_DIR')
+
+class FileCacheBackend:
+    def __init__(self, directory, ttl):
+        self.directory = directory
+        self.ttl = ttl
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, hashlib.sha1(key.encode('utf-8')).hexdigest())
+
+    def get(self, key):
+        path = self._path(key)
+        try:
+            if os.path.getmtime(path) + self.ttl < time.time():
+                return None
+            with open(path, encoding='utf-8') as cached:
+                return cached.read()
+        except OSError:
+            return None
+
+    def set(self, key, value):
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix='.fragment-')
+        with os.fdopen(fd, 'w', encoding='utf-8') as out:
+            out.write(value)
+        os.replace(tmp_path, self._path(key))
+
+    def delete(self, key):
+        remove_file(self._path(key))
+
+class FragmentCache:
+    def __init__(self, local, shared=None):
+        self.local = local
+        self.shared = shared
+
+    def get_or_render(self, key, render):
+        value = self.local.get(key)
+        if value is None and self.shared is not None:
+            value = self.shared.get(key)
+            if value is not None:
+                self.local.set(key, value)
+        if value is None:
+            value = render()
+            self.set(key, value)
+        return value
+
+    def set(self, key, value):
+        self.local.set(key, value)
+        if self.shared is not None:
+            self.shared.set(key, value)
+
+    def delete(self, key):
+        self.local.invalidate(key)
+        if self.shared is not None:
+            self.shared.delete(key)
+
+# The app's 'fragment' cache, with the shared tier when FRAGMENT_CACHE_DIR is set
+def new_fragment_cache(config):
+    shared = FileCacheBackend(config['FRAGMENT_CACHE_DIR'], config['FRAGMENT_CACHE_TTL']) if config['FRAGMENT_CACHE_DIR'] else None
+    return FragmentCache(TTLCache(config['FRAGMENT_CACHE_SIZE'], config['FRAGMENT_CACHE_TTL']), shared)
+
+def vacancy_card_key(vacancy):
+    changed = vacancy.updated_at or vacancy.posted_date
+    return f"vacancy-card:{vacancy.id}:{changed.timestamp() if changed else 0}"
+
+def render_vacancy_card(vacancy):
+    return render_template('vacancy_card.html', vacancy=vacancy)
+
+# [(vacancy, card_html)] with each card served from the cache when possible
+def vacancy_cards(vacancies):
+    return [
+        (vacancy, Markup(app_cache('fragment').get_or_render(vacancy_card_key(vacancy), lambda: render_vacancy_card(vacancy))))
+        for vacancy in vacancies
+    ]
+
+# Ids among `vacancies` the student already applied to, in one query
+def applied_vacancy_ids(student_id, vacancies):
+    if not vacancies:
+        return set()
+    rows = db.session.query(Application.vacancy_id).filter(
+        Application.student_id == student_id,
+        Application.vacancy_id.in_([vacancy.id for vacancy in vacancies]),
+    )
+    return {row[0] for row in rows}
 
 # --------------------for std-----------------------
-# all vacancies available for students 
-@app.route('/student/vacancies')
+default_config['VACANCIES_PER_PAGE'] = 20
+
+# Keyset cursor helpers: a cursor is the (posted_date, id) of the last vacancy on a page
+def encode_vacancy_cursor(vacancy):
+    raw = f"{vacancy.posted_date.isoformat()}|{vacancy.id}"
+    return base64.urlsafe_b64encode(raw.encode('utf-8')).decode('ascii')
+
+def decode_vacancy_cursor(cursor):
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+        posted_date, vacancy_id = raw.split('|', 1)
+        return datetime.fromisoformat(posted_date), int(vacancy_id)
+    except (ValueError, UnicodeError):
+        return None
+
+# all open vacancies available for students, newest first, one page at a time
+@vacancy_bp.route('/student/vacancies')
+@read_replica
 @login_required
 def student_vacancies():
     if current_user.role != 'student':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
+
+    location = request.args.get('location', '').strip()
+    cursor = request.args.get('after')
+    per_page = current_app.config['VACANCIES_PER_PAGE']
+
+    # Only vacancies that are still open, filtered in the database
+    query = Vacancy.query.filter(Vacancy.last_date >= datetime.utcnow())
+    if location:
+        query = query.filter(Vacancy.location == location)
+
+    # Seek past the last row of the previous page instead of using OFFSET
+    position = decode_vacancy_cursor(cursor) if cursor else None
+    if position:
+        query = query.filter(db.tuple_(Vacancy.posted_date, Vacancy.id) < position)
+
+    # Fetch one extra row to know whether there is a next page
+    vacancies = query.order_by(Vacancy.posted_date.desc(), Vacancy.id.desc()).limit(per_page + 1).all()
+    next_cursor = None
+    if len(vacancies) > per_page:
+        vacancies = vacancies[:per_page]
+        next_cursor = encode_vacancy_cursor(vacancies[-1])
+
+    return render_template('student_vacancies.html', cards=vacancy_cards(vacancies), location=location,
+                           applied_ids=applied_vacancy_ids(current_user.id, vacancies),
+                           next_cursor=next_cursor, is_first_page=position is None)
+
+# ==================== vacancy search ==============================================
+# Full-text search runs against an inverted index instead of LIKE '%term%' scans.
+# SQLite uses an FTS5 table kept in step with create_vacancy/delete_vacancy; MySQL uses
+# a FULLTEXT index that InnoDB maintains by itself. Backends are picked by dialect name
+# unless SEARCH_BACKEND is set.
+default_config['SEARCH_BACKEND'] = None
+MAX_SEARCH_TERMS = 10
+
+def search_terms(query):
+    return re.findall(r'\w+', query.lower())[:MAX_SEARCH_TERMS]
+
+class VacancySearchBackend:
+    # Every method takes something with .execute() (db.session or a Connection), so index
+    # updates share the caller's transaction.
+    def create_index(self, connection):
+        raise NotImplementedError
+
+    def rebuild(self, connection):
+        raise NotImplementedError
+
+    def index_vacancy(self, connection, vacancy):
+        raise NotImplementedError
+
+    # Bulk form of index_vacancy for freshly inserted rows: dicts with id/title/description/location
+    def index_vacancies(self, connection, rows):
+        raise NotImplementedError
+
+    def remove_vacancy(self, connection, vacancy_id):
+        raise NotImplementedError
+
+    # Returns [(vacancy_id, score)] for open vacancies, best match first
+    def search(self, connection, terms, now, limit, offset):
+        raise NotImplementedError
+
+class SQLiteVacancySearch(VacancySearchBackend):
+    def create_index(self, connection):
+        connection.execute(text(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS vacancy_fts "
+            "USING fts5(title, description, location, tokenize='porter unicode61')"
+        ))
+
+    def rebuild(self, connection):
+        connection.execute(text("DELETE FROM vacancy_fts"))
+        connection.execute(text(
+            "INSERT INTO vacancy_fts (rowid, title, description, location) "
+            "SELECT id, title, description, location FROM vacancy"
+        ))
+
+    def index_vacancy(self, connection, vacancy):
+        self.remove_vacancy(connection, vacancy.id)
+        self.index_vacancies(connection, [
+            {'id': vacancy.id, 'title': vacancy.title, 'description': vacancy.description, 'location': vacancy.location},
+        ])
+
+    def index_vacancies(self, connection, rows):
+        connection.execute(
+            text("INSERT INTO vacancy_fts (rowid, title, description, location) VALUES (:id, :title, :description, :location)"),
+            [{'id': row['id'], 'title': row['title'], 'description': row['description'], 'location': row['location']} for row in rows],
+        )
+
+    def remove_vacancy(self, connection, vacancy_id):
+        connection.execute(text("DELETE FROM vacancy_fts WHERE rowid = :id"), {'id': vacancy_id})
+
+    def search(self, connection, terms, now, limit, offset):
+        # Quote every term so user input is never parsed as FTS5 syntax; prefix-match each one
+        match = ' '.join('"%s"*' % term.replace('"', '""') for term in terms)
+        rows = connection.execute(text(
+            "SELECT vacancy.id, bm25(vacancy_fts, 10.0, 1.0, 2.0) AS rank "
+            "FROM vacancy_fts JOIN vacancy ON vacancy.id = vacancy_fts.rowid "
+            "WHERE vacancy_fts MATCH :match AND vacancy.last_date >= :now "
+            "ORDER BY rank LIMIT :limit OFFSET :offset"
+        ), {'match': match, 'now': now, 'limit': limit, 'offset': offset})
+        return [(row.id, -row.rank) for row in rows]
+
+class MySQLVacancySearch(VacancySearchBackend):
+    def create_index(self, connection):
+        exists = connection.execute(text(
+            "SELECT COUNT(*) FROM information_schema.statistics "
+            "WHERE table_schema = DATABASE() AND table_name = 'vacancy' AND index_name = 'ft_vacancy_text'"
+        )).scalar()
+        if not exists:
+            connection.execute(text("ALTER TABLE vacancy ADD FULLTEXT INDEX ft_vacancy_text (title, description, location)"))
+
+    # InnoDB keeps FULLTEXT indexes current on INSERT/DELETE, so there is nothing to do here
+    def rebuild(self, connection):
+        pass
+
+    def index_vacancy(self, connection, vacancy):
+        pass
+
+    def index_vacancies(self, connection, rows):
+        pass
+
+    def remove_vacancy(self, connection, vacancy_id):
+        pass
+
+    def search(self, connection, terms, now, limit, offset):
+        match = ' '.join('+%s*' % term for term in terms)
+        rows = connection.execute(text(
+            "SELECT id, MATCH (title, description, location) AGAINST (:match IN BOOLEAN MODE) AS score "
+            "FROM vacancy "
+            "WHERE MATCH (title, description, location) AGAINST (:match IN BOOLEAN MODE) AND last_date >= :now "
+            "ORDER BY score DESC, id DESC LIMIT :limit OFFSET :offset"
+        ), {'match': match, 'now': now, 'limit': limit, 'offset': offset})
+        return [(row.id, row.score) for row in rows]
+
+SEARCH_BACKENDS = {
+    'sqlite': SQLiteVacancySearch(),
+    'mysql': MySQLVacancySearch(),
+}
+
+def vacancy_search(dialect_name=None):
+    return SEARCH_BACKENDS[current_app.config['SEARCH_BACKEND'] or dialect_name or db.engine.dialect.name]
+
+# Create the search index whenever db.create_all() creates the schema
+@event.listens_for(db.metadata, 'after_create')
+def create_search_index(target, connection, **kw):
+    vacancy_search(connection.dialect.name).create_index(connection)
+
+@vacancy_bp.cli.command('rebuild-search-index')
+def rebuild_search_index():
+    vacancy_search().rebuild(db.session)
+    db.session.commit()
+    print('Vacancy search index rebuilt.')
+
+@vacancy_bp.route('/student/vacancies/search')
+@login_required
+def search_vacancies():
+    if current_user.role != 'student':
+        flash('Access denied!', 'danger')
+        return redirect(url_for('auth.index'))
+
+    query = request.args.get('q', '').strip()
+    page = max(request.args.get('page', 1, type=int), 1)
+    per_page = current_app.config['VACANCIES_PER_PAGE']
+
+    vacancies = []
+    has_next = False
+    terms = search_terms(query)
+    if terms:
+        # Ranked ids come from the index; one more query loads the rows for this page
+        hits = vacancy_search().search(db.session, terms, datetime.utcnow(), per_page + 1, (page - 1) * per_page)
+        has_next = len(hits) > per_page
+        hits = hits[:per_page]
+        by_id = {vacancy.id: vacancy for vacancy in Vacancy.query.filter(Vacancy.id.in_([hit[0] for hit in hits]))}
+        vacancies = [by_id[vacancy_id] for vacancy_id, _ in hits if vacancy_id in by_id]
+
+    return render_template('search_vacancies.html', cards=vacancy_cards(vacancies), query=query, page=page,
+                           has_next=has_next, applied_ids=applied_vacancy_ids(current_user.id, vacancies))
+
+# ==================== skill matching ==============================================
+# Students' free-form skills and vacancies' title/description are normalized into
+# skill terms and kept in two inverted indexes, student_skill and vacancy_skill, which
+# the write routes update incrementally. Matching reads only the posting lists for the
+# skills in question and scores them with sparse TF-IDF in NumPy, so a student's
+# recommendations cost the same however many other students there are.
+default_config['RECOMMENDATIONS_LIMIT'] = 5
+default_config['SUGGESTED_CANDIDATES_LIMIT'] = 20
+MAX_STUDENT_SKILLS = 50
+
+class StudentSkill(db.Model):
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), primary_key=True)
+    skill = db.Column(db.String(100), primary_key=True)
+
+    __table_args__ = (db.Index('ix_student_skill_skill', 'skill', 'user_id'),)
+
+class VacancySkill(db.Model):
+    vacancy_id = db.Column(db.Integer, db.ForeignKey('vacancy.id'), primary_key=True)
+    skill = db.Column(db.String(100), primary_key=True)
+    tf = db.Column(db.Integer, nullable=False, default=1)  # occurrences in the vacancy text
+
+    __table_args__ = (db.Index('ix_vacancy_skill_skill', 'skill', 'vacancy_id', 'tf'),)
+
+SKILL_ALIASES = {
+    'js': 'javascript', 'ts': 'typescript', 'py': 'python', 'golang': 'go',
+    'reactjs': 'react', 'react.js': 'react', 'nodejs': 'node', 'node.js': 'node',
+    'vuejs': 'vue', 'vue.js': 'vue', 'postgres': 'postgresql', 'k8s': 'kubernetes',
+    'ml': 'machine learning', 'ai': 'artificial intelligence', 'nlp': 'natural language processing',
+    'ms excel': 'excel', 'html5': 'html', 'css3': 'css',
+}
+SKILL_STOPWORDS = set(
+    'a an and are as at be by for from has have in is it of on or our the to we will with you your '
+    'who what this that their they can all any etc also into must should would work working job role '
+    'team candidate candidates experience years year good strong knowledge skills skill ability'.split()
+)
+SKILL_TOKEN = re.compile(r'[a-z0-9][a-z0-9+#.]*[a-z0-9+#]|[a-z0-9]')
+SKILL_SEPARATORS = re.compile(r'[,;/|\n]+')
+
+def normalize_skill(phrase):
+    normalized = ' '.join(SKILL_TOKEN.findall(phrase.lower()))
+    return SKILL_ALIASES.get(normalized, normalized)[:100]
+
+# "Python, Flask; ML" -> ['python', 'flask', 'machine learning']
+def student_skill_terms(skills_text):
+    terms = []
+    for phrase in SKILL_SEPARATORS.split(skills_text or ''):
+        term = normalize_skill(phrase)
+        if term and term not in terms:
+            terms.append(term)
+    return terms[:MAX_STUDENT_SKILLS]
+
+# Unigrams and bigrams of the text with their counts, so both "python" and
+# "machine learning" can match a student's skill
+def text_terms(text):
+    words = [SKILL_ALIASES.get(word, word) for word in SKILL_TOKEN.findall(text.lower())]
+    counts = {}
+    for index, word in enumerate(words):
+        if word in SKILL_STOPWORDS:
+            continue
+        counts[word] = counts.get(word, 0) + 1
+        if index + 1 < len(words) and words[index + 1] not in SKILL_STOPWORDS:
+            bigram = f'{word} {words[index + 1]}'
+            counts[bigram] = counts.get(bigram, 0) + 1
+    return {term[:100]: count for term, count in counts.items()}
+
+def vacancy_skill_terms(title, description):
+    return text_terms(f'{title} {description}')
+
+def index_student_skills(user_id, skills_text):
+    db.session.execute(db.delete(StudentSkill).where(StudentSkill.user_id == user_id))
+    terms = student_skill_terms(skills_text)
+    if terms:
+        db.session.execute(db.insert(StudentSkill), [{'user_id': user_id, 'skill': term} for term in terms])
+
+# rows are dicts with id/title/description, e.g. a created vacancy or an import batch
+def index_vacancy_skills(rows):
+    postings = [
+        {'vacancy_id': row['id'], 'skill': term, 'tf': count}
+        for row in rows
+        for term, count in vacancy_skill_terms(row['title'], row['description']).items()
+    ]
+    if postings:
+        db.session.execute(db.insert(VacancySkill), postings)
+
+def remove_vacancy_skills(vacancy_id):
+    db.session.execute(db.delete(VacancySkill).where(VacancySkill.vacancy_id == vacancy_id))
+
+# Corpus sizes only shift idf slightly, so they are cached briefly (the app's 'corpus_size'
+# cache) instead of counted per request
+
+def corpus_size(name, count_query):
+    size = app_cache('corpus_size').get(name)
+    if size is None:
+        size = count_query.scalar() or 0
+        app_cache('corpus_size').set(name, size)
+    return size
+
+# postings are (doc_id, skill, tf) rows for the query's skills. Each matched skill adds
+# (1 + log tf) * idf(skill) * query_weight to the document's score. Returns the top
+# `limit` documents as [(doc_id, score, matched_skills)].
+def score_postings(postings, documents, limit, query_weights=None):
+    if not postings:
+        return []
+    import numpy as np
+    skill_ids = {}
+    doc_ids = np.fromiter((posting[0] for posting in postings), dtype=np.int64, count=len(postings))
+    skill_pos = np.fromiter((skill_ids.setdefault(posting[1], len(skill_ids)) for posting in postings), dtype=np.int64, count=len(postings))
+    tf = np.fromiter((posting[2] for posting in postings), dtype=np.float64, count=len(postings))
+
+    unique_docs, doc_pos = np.unique(doc_ids, return_inverse=True)
+    df = np.bincount(skill_pos, minlength=len(skill_ids))
+    idf = np.log((1.0 + max(documents, len(unique_docs))) / (1.0 + df)) + 1.0
+    weights = (1.0 + np.log(tf)) * idf[skill_pos]
+    if query_weights:
+        weights *= np.array([query_weights.get(skill, 1.0) for skill in skill_ids])[skill_pos]
+
+    scores = np.bincount(doc_pos, weights=weights)
+    top = np.argsort(-scores, kind='stable')[:limit]
+
+    matched = {}
+    top_docs = set(unique_docs[top].tolist())
+    for doc_id, skill, _ in postings:
+        if doc_id in top_docs:
+            matched.setdefault(doc_id, []).append(skill)
+    return [(int(unique_docs[i]), float(scores[i]), matched[int(unique_docs[i])]) for i in top]
+
+# Open vacancies the student has not applied to yet, best skill match first
+def recommend_vacancies(user_id, limit):
+    skills = [row.skill for row in StudentSkill.query.filter_by(user_id=user_id)]
+    if not skills:
+        return []
+
+    now = datetime.utcnow()
+    applied = db.select(Application.vacancy_id).where(Application.student_id == user_id)
+    postings = (db.session.query(VacancySkill.vacancy_id, VacancySkill.skill, VacancySkill.tf)
+                .join(Vacancy, Vacancy.id == VacancySkill.vacancy_id)
+                .filter(VacancySkill.skill.in_(skills), Vacancy.last_date >= now, VacancySkill.vacancy_id.notin_(applied))
+                .all())
+    documents = corpus_size('open_vacancies', db.session.query(db.func.count(Vacancy.id)).filter(Vacancy.last_date >= now))
+    ranked = score_postings(postings, documents, limit)
+
+    vacancies = {vacancy.id: vacancy for vacancy in Vacancy.query.filter(Vacancy.id.in_([doc_id for doc_id, _, _ in ranked]))}
+    return [(vacancies[doc_id], matched) for doc_id, _, matched in ranked if doc_id in vacancies]
+
+# Students whose skills appear in the vacancy text, best match first
+def suggest_candidates(vacancy, limit):
+    terms = {row.skill: row.tf for row in VacancySkill.query.filter_by(vacancy_id=vacancy.id)}
+    if not terms:
+        return []
+
+    postings = (db.session.query(StudentSkill.user_id, StudentSkill.skill, db.literal(1))
+                .filter(StudentSkill.skill.in_(list(terms)))
+                .all())
+    documents = corpus_size('students_with_skills', db.session.query(db.func.count(db.distinct(StudentSkill.user_id))))
+    query_weights = {term: 1.0 + math.log(tf) for term, tf in terms.items()}
+    ranked = score_postings(postings, documents, limit, query_weights)
+
+    students = {user.id: user for user in User.query
+                .filter(User.id.in_([doc_id for doc_id, _, _ in ranked]))
+                .options(db.joinedload(User.student_details))}
+    return [(students[doc_id], matched) for doc_id, _, matched in ranked if doc_id in students]
+
+@vacancy_bp.cli.command('rebuild-skill-index')
+def rebuild_skill_index():
+    db.session.execute(db.delete(StudentSkill))
+    for details in StudentDetails.query:
+        index_student_skills(details.user_id, details.skills)
+    db.session.execute(db.delete(VacancySkill))
+    index_vacancy_skills([{'id': vacancy.id, 'title': vacancy.title, 'description': vacancy.description} for vacancy in Vacancy.query])
+    db.session.commit()
+    print('Skill index rebuilt.')
+
+@company_bp.route('/company/vacancies/<int:vacancy_id>/candidates')
+@login_required
+def suggested_candidates(vacancy_id):
+    if current_user.role != 'company':
+        flash('Access denied!', 'danger')
+        return redirect(url_for('auth.index'))
+
+    vacancy = Vacancy.query.get_or_404(vacancy_id)
+    if vacancy.company_id != current_user.id:
+        flash('This vacancy does not belong to your company.', 'danger')
+        return redirect(url_for('vacancy.view_company_vacancies'))
+
+    candidates = suggest_candidates(vacancy, current_app.config['SUGGESTED_CANDIDATES_LIMIT'])
+    return render_template('suggested_candidates.html', vacancy=vacancy, candidates=candidates)
+
+# ==================== resume text search ==============================================
+# Uploaded resumes are turned into plain text in a process pool (PDF via pypdf, DOCX from
+# its XML, legacy DOC by pulling out the text runs). The text is stored zlib-compressed in
+# resume_text and its terms go into the resume_term inverted index. Companies search their
+# applicants' resumes through that index, ranked with the same TF-IDF scoring as skill
+# matching. `flask extract-resumes` backfills resumes uploaded before the index existed.
+default_config['RESUME_EXTRACT_WORKERS'] = int(os.environ.get('RESUME_EXTRACT_WORKERS', 2))  # 0 = extract inline
+default_config['RESUME_SEARCH_LIMIT'] = 20
+RESUME_TEXT_MAX_CHARS = 200_000
+MAX_RESUME_TERMS = 2000
+RESUME_BACKFILL_CHUNK = 50
+
+class ResumeText(db.Model):
+    resume_id = db.Column(db.Integer, db.ForeignKey('resume.id'), primary_key=True)
+    blob_hash = db.Column(db.String(64), index=True)  # the file the text came from, None for legacy files
+    content = db.Column(db.LargeBinary)  # zlib-compressed UTF-8
+    error = db.Column(db.String(255))
+    extracted_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    @property
+    def text(self):
+        return zlib.decompress(self.content).decode('utf-8') if self.content else ''
+
+class ResumeTerm(db.Model):
+    resume_id = db.Column(db.Integer, db.ForeignKey('resume.id'), primary_key=True)
+    term = db.Column(db.String(100), primary_key=True)
+    tf = db.Column(db.Integer, nullable=False, default=1)
+
+    __table_args__ = (db.Index('ix_resume_term_term', 'term', 'resume_id', 'tf'),)
+
+WORD_NAMESPACE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+DOC_TEXT_RUN = re.compile(rb'(?:[\x20-\x7e]\x00){4,}|[\x20-\x7e]{6,}')
+
+def extract_docx_text(path):
+    with zipfile.ZipFile(path) as archive:
+        root = ElementTree.fromstring(archive.read('word/document.xml'))
+    return '\n'.join(''.join(node.text or '' for node in paragraph.iter(WORD_NAMESPACE + 't'))
+                     for paragraph in root.iter(WORD_NAMESPACE + 'p'))
+
+# Word 97 files keep their text as UTF-16 or 8-bit runs between binary structures
+def extract_doc_text(path):
+    with open(path, 'rb') as document:
+        data = document.read()
+    runs = [run.decode('utf-16-le') if run[1:2] == b'\x00' else run.decode('latin-1') for run in DOC_TEXT_RUN.findall(data)]
+    return '\n'.join(run for run in runs if re.search(r'[A-Za-z]{3}', run))
+
+# Runs in the pool processes
+def extract_resume_text(path, filename):
+    extension = filename.rsplit('.', 1)[-1].lower()
+    if extension == 'pdf':
+        import pypdf
+        text = '\n'.join(page.extract_text() or '' for page in pypdf.PdfReader(path).pages)
+    elif extension == 'docx':
+        text = extract_docx_text(path)
+    elif extension == 'doc':
+        text = extract_doc_text(path)
+    else:
+        raise ValueError(f'unsupported resume type: {extension}')
+    return ' '.join(text.split())[:RESUME_TEXT_MAX_CHARS]
+
+def index_resume_text(resume_id, blob_hash, text, error=None):
+    remove_resume_text(resume_id)
+    db.session.add(ResumeText(resume_id=resume_id, blob_hash=blob_hash, error=error and str(error)[:255],
+                              content=zlib.compress(text.encode('utf-8')) if text else None))
+    terms = sorted(text_terms(text or '').items(), key=lambda item: -item[1])[:MAX_RESUME_TERMS]
+    if terms:
+        db.session.execute(db.insert(ResumeTerm), [{'resume_id': resume_id, 'term': term, 'tf': tf} for term, tf in terms])
+
+def remove_resume_text(resume_id):
+    db.session.execute(db.delete(ResumeTerm).where(ResumeTerm.resume_id == resume_id))
+    db.session.execute(db.delete(ResumeText).where(ResumeText.resume_id == resume_id))
+
+# Another resume with the same blob was already extracted: copy its text and postings
+def copy_resume_text(resume_id, blob_hash):
+    source = (ResumeText.query.filter(ResumeText.blob_hash == blob_hash, ResumeText.resume_id != resume_id)
+              .order_by(ResumeText.resume_id).first()) if blob_hash else None
+    if source is None:
+        return False
+    remove_resume_text(resume_id)
+    db.session.add(ResumeText(resume_id=resume_id, blob_hash=blob_hash, content=source.content, error=source.error))
+    db.session.execute(db.insert(ResumeTerm).from_select(
+        ['resume_id', 'term', 'tf'],
+        db.select(db.literal(resume_id), ResumeTerm.term, ResumeTerm.tf).where(ResumeTerm.resume_id == source.resume_id)))
+    return True
+
+resume_executor = None
+resume_executor_pid = None
+
+def get_resume_executor():
+    global resume_executor, resume_executor_pid
+    if resume_executor is None or resume_executor_pid != os.getpid():
+        resume_executor = ProcessPoolExecutor(max_workers=current_app.config['RESUME_EXTRACT_WORKERS'])
+        resume_executor_pid = os.getpid()
+    return resume_executor
+
+# Done-callback of an extraction job; skips the result if the resume changed meanwhile.
+# It runs on the pool's result thread, so it is given the app to push a context for.
+def store_extracted_text(app, resume_id, blob_hash, future):
+    error = future.exception()
+    text = None if error else future.result()
+    with app.app_context():
+        try:
+            resume = db.session.get(Resume, resume_id)
+            if resume is None or resume.blob_hash != blob_hash:
+                return
+            if error:
+                app.logger.warning('Could not extract text from resume %s: %s', resume_id, error)
+            index_resume_text(resume_id, blob_hash, text, error)
+            db.session.commit()
+        except Exception:
+            db.session.rollback()
+            app.logger.exception('Could not index resume %s', resume_id)
+        finally:
+            db.session.remove()
+
+# Called after the resume row is committed; extraction never blocks the request
+def queue_resume_extraction(resume):
+    if copy_resume_text(resume.id, resume.blob_hash):
+        db.session.commit()
+        return None
+    path = resume_path(resume)
+    if current_app.config['RESUME_EXTRACT_WORKERS'] <= 0:
+        future = Future()
+        try:
+            future.set_result(extract_resume_text(path, resume.filename))
+        except Exception as error:
+            future.set_exception(error)
+    else:
+        future = get_resume_executor().submit(extract_resume_text, path, resume.filename)
+    future.add_done_callback(functools.partial(store_extracted_text, current_app._get_current_object(), resume.id, resume.blob_hash))
+    return future
+
+# Ranked search over the resumes of students who applied to this company's vacancies
+def search_applicant_resumes(company_id, query, limit, vacancy_id=None):
+    terms = list(text_terms(query))
+    if not terms:
+        return []
+
+    applicants = db.select(Application.student_id).join(Vacancy, Vacancy.id == Application.vacancy_id).where(Vacancy.company_id == company_id)
+    if vacancy_id:
+        applicants = applicants.where(Application.vacancy_id == vacancy_id)
+    postings = (db.session.query(ResumeTerm.resume_id, ResumeTerm.term, ResumeTerm.tf)
+                .join(Resume, Resume.id == ResumeTerm.resume_id)
+                .filter(ResumeTerm.term.in_(terms), Resume.user_id.in_(applicants))
+                .all())
+    documents = corpus_size('indexed_resumes', db.session.query(db.func.count(ResumeText.resume_id)))
+    ranked = score_postings(postings, documents, limit)
+
+    ids = [doc_id for doc_id, _, _ in ranked]
+    resumes = {resume.id: resume for resume in Resume.query.filter(Resume.id.in_(ids)).options(db.joinedload(Resume.user))}
+    texts = {row.resume_id: row for row in ResumeText.query.filter(ResumeText.resume_id.in_(ids))}
+    return [(resumes[doc_id], matched, resume_snippet(texts[doc_id].text if doc_id in texts else '', matched))
+            for doc_id, _, matched in ranked if doc_id in resumes]
+
+def resume_snippet(text, terms, width=100):
+    lowered = text.lower()
+    positions = [lowered.find(term) for term in terms if lowered.find(term) >= 0]
+    if not positions:
+        return text[:width * 2]
+    start = max(0, min(positions) - width)
+    return ('...' if start else '') + text[start:start + width * 2] + '...'
+
+@resume_bp.cli.command('extract-resumes')
+@click.option('--all', 'reindex', is_flag=True, help='Re-extract resumes that already have text.')
+def extract_resumes_command(reindex):
+    query = Resume.query.order_by(Resume.id)
+    if not reindex:
+        query = query.filter(~db.exists().where(ResumeText.resume_id == Resume.id))
+    jobs = [(resume.id, resume.blob_hash, resume_path(resume), resume.filename) for resume in query]
+
+    # Extract each distinct file once, in parallel; resumes sharing a blob share the result
+    files = {}
+    for resume_id, blob_hash, path, filename in jobs:
+        files.setdefault(blob_hash or path, (path, filename))
+    workers = max(current_app.config['RESUME_EXTRACT_WORKERS'], 1)
+    extracted = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {key: executor.submit(extract_resume_text, path, filename) for key, (path, filename) in files.items()}
+        for key, future in futures.items():
+            try:
+                extracted[key] = (future.result(), None)
+            except Exception as error:
+                extracted[key] = (None, error)
+
+    failed = 0
+    for start in range(0, len(jobs), RESUME_BACKFILL_CHUNK):
+        for resume_id, blob_hash, path, filename in jobs[start:start + RESUME_BACKFILL_CHUNK]:
+            text, error = extracted[blob_hash or path]
+            failed += error is not None
+            index_resume_text(resume_id, blob_hash, text, error)
+        db.session.commit()
+    print(f'Extracted {len(jobs)} resumes from {len(files)} files; {failed} could not be read.')
+
+@company_bp.route('/company/resumes/search')
+@read_replica
+@login_required
+def search_resumes():
+    if current_user.role != 'company':
+        flash('Access denied!', 'danger')
+        return redirect(url_for('auth.index'))
+
+    query = request.args.get('q', '').strip()
+    vacancy_id = request.args.get('vacancy_id', type=int)
+    results = search_applicant_resumes(current_user.id, query, current_app.config['RESUME_SEARCH_LIMIT'], vacancy_id) if query else []
+    vacancies = Vacancy.query.filter_by(company_id=current_user.id).order_by(Vacancy.title).all()
+    return render_template('search_resumes.html', query=query, vacancy_id=vacancy_id, vacancies=vacancies, results=results)
+
+# ==================== vacancy archive ==============================================
+# Vacancies past last_date, with their applications, are moved to archive tables in
+# batches so the live tables only hold open postings. Run `flask archive-expired-vacancies`
+# from cron, or set VACANCY_ARCHIVE_INTERVAL to let each worker run it in a background
+# thread. Companies can still browse archived vacancies and their applicants.
+default_config['VACANCY_ARCHIVE_INTERVAL'] = int(os.environ.get('VACANCY_ARCHIVE_INTERVAL', 0))  # seconds, 0 = off
+default_config['VACANCY_ARCHIVE_BATCH_SIZE'] = 500
+default_config['ARCHIVED_VACANCIES_PER_PAGE'] = 50
+
+# Archived rows get ids of their own: a live id can be handed out again once its row is
+# deleted, so the same original_id may be archived more than once.
+class ArchivedVacancy(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    original_id = db.Column(db.Integer, nullable=False)  # the id the vacancy had while live
+    company_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    title = db.Column(db.String(100), nullable=False)
+    description = db.Column(db.Text, nullable=False)
+    location = db.Column(db.String(100), nullable=False)
+    posted_date = db.Column(db.DateTime)
+    last_date = db.Column(db.DateTime, nullable=False)
+    archived_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    __table_args__ = (
+        db.Index('ix_archived_vacancy_company_id_last_date', 'company_id', 'last_date'),
+        db.Index('ix_archived_vacancy_original_id', 'original_id'),
+    )
+
+class ArchivedApplication(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    original_id = db.Column(db.Integer, nullable=False)  # the id the application had while live
+    student_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    vacancy_id = db.Column(db.Integer, db.ForeignKey('archived_vacancy.id'), nullable=False, index=True)
+    status = db.Column(db.String(20))
+    applied_date = db.Column(db.DateTime)
+
+    student = db.relationship('User', foreign_keys=[student_id])
+
+VACANCY_ARCHIVE_COLUMNS = ['company_id', 'title', 'description', 'location', 'posted_date', 'last_date']
+APPLICATION_ARCHIVE_COLUMNS = ['student_id', 'status', 'applied_date']
+
+class ArchiveBatchChanged(Exception):
+    pass
+
+# Move one batch of expired vacancies; returns (vacancies, applications) archived
+def archive_vacancy_batch(now, batch_size):
+    expired = (db.session.query(Vacancy.id, Vacancy.updated_at, Vacancy.posted_date)
+               .filter(Vacancy.last_date < now)
+               .order_by(Vacancy.last_date, Vacancy.id)
+               .limit(batch_size)
+               .all())
+    if not expired:
+        return 0, 0
+    vacancy_ids = [row.id for row in expired]
+
+    # Copy first, then delete, all in one transaction per batch
+    archived_at = datetime.utcnow()
+    db.session.execute(db.insert(ArchivedVacancy).from_select(
+        ['original_id', 'archived_at', *VACANCY_ARCHIVE_COLUMNS],
+        db.select(Vacancy.id, db.literal(archived_at, db.DateTime), *[getattr(Vacancy, column) for column in VACANCY_ARCHIVE_COLUMNS])
+        .where(Vacancy.id.in_(vacancy_ids))))
+
+    # live vacancy id -> the archived row just inserted for it (the newest one, should the
+    # id have been archived before)
+    archived_ids = dict(db.session.execute(
+        db.select(ArchivedVacancy.original_id, db.func.max(ArchivedVacancy.id))
+        .where(ArchivedVacancy.original_id.in_(vacancy_ids))
+        .group_by(ArchivedVacancy.original_id)).all())
+    applications = db.session.execute(db.insert(ArchivedApplication).from_select(
+        ['original_id', 'vacancy_id', *APPLICATION_ARCHIVE_COLUMNS],
+        db.select(Application.id, db.case(archived_ids, value=Application.vacancy_id),
+                  *[getattr(Application, column) for column in APPLICATION_ARCHIVE_COLUMNS])
+        .where(Application.vacancy_id.in_(vacancy_ids)))).rowcount
+
+    search = vacancy_search()
+    for vacancy_id in vacancy_ids:
+        search.remove_vacancy(db.session, vacancy_id)
+    db.session.execute(db.delete(VacancySkill).where(VacancySkill.vacancy_id.in_(vacancy_ids)))
+    db.session.execute(db.delete(VacancyApplicationStats).where(VacancyApplicationStats.vacancy_id.in_(vacancy_ids)))
+    deleted_applications = db.session.execute(db.delete(Application).where(Application.vacancy_id.in_(vacancy_ids))).rowcount
+    deleted = db.session.execute(db.delete(Vacancy).where(Vacancy.id.in_(vacancy_ids))).rowcount
+    if deleted != len(vacancy_ids) or deleted_applications != applications:
+        # Another worker archived (or a company deleted) some of these vacancies since we
+        # read them, or an application was not copied; delete nothing that is not archived
+        db.session.rollback()
+        raise ArchiveBatchChanged()
+    db.session.commit()
+
+    for row in expired:
+        app_cache('fragment').delete(vacancy_card_key(row))
+    return len(vacancy_ids), applications
+
+# Archive everything that expired before `now`, batch by batch. If rows of our batch
+# changed underneath it (usually another worker archiving it first), the batch is rolled
+# back and this run stops; the next run picks up whatever is still live.
+def archive_expired_vacancies(now=None, batch_size=None):
+    now = now or datetime.utcnow()
+    batch_size = batch_size or current_app.config['VACANCY_ARCHIVE_BATCH_SIZE']
+    vacancies = applications = 0
+    while True:
+        try:
+            moved, moved_applications = archive_vacancy_batch(now, batch_size)
+        except ArchiveBatchChanged:
+            current_app.logger.warning('Vacancy archive batch changed while it was archived; rolled back')
+            break
+        if not moved:
+            break
+        vacancies += moved
+        applications += moved_applications
+    return vacancies, applications
+
+@vacancy_bp.cli.command('archive-expired-vacancies')
+def archive_expired_vacancies_command():
+    vacancies, applications = archive_expired_vacancies()
+    print(f'Archived {vacancies} expired vacancies and {applications} applications.')
+
+vacancy_archiver = None
+vacancy_archiver_pid = None
+
+def run_vacancy_archiver(app, interval):
+    while True:
+        time.sleep(interval)
+        with app.app_context():
+            try:
+                vacancies, applications = archive_expired_vacancies()
+                if vacancies:
+                    app.logger.info('Archived %d expired vacancies and %d applications', vacancies, applications)
+            except Exception:
+                app.logger.exception('Vacancy archive run failed')
+            finally:
+                db.session.remove()
+
+# Started on the first request in each process, so preforked workers each get their own thread
+@ops_bp.before_app_request
+def start_vacancy_archiver():
+    global vacancy_archiver, vacancy_archiver_pid
+    interval = current_app.config['VACANCY_ARCHIVE_INTERVAL']
+    if interval <= 0 or (vacancy_archiver is not None and vacancy_archiver_pid == os.getpid()):
+        return
+    vacancy_archiver = threading.Thread(target=run_vacancy_archiver, args=(current_app._get_current_object(), interval), name='vacancy-archiver', daemon=True)
+    vacancy_archiver.start()
+    vacancy_archiver_pid = os.getpid()
+
+@vacancy_bp.route('/company/vacancies/archived')
+@read_replica
+@login_required
+def archived_vacancies():
+    if current_user.role != 'company':
+        flash('Access denied!', 'danger')
+        return redirect(url_for('auth.index'))
+
+    page = request.args.get('page', 1, type=int)
+    pagination = (ArchivedVacancy.query
+                  .filter_by(company_id=current_user.id)
+                  .order_by(ArchivedVacancy.last_date.desc(), ArchivedVacancy.id.desc())
+                  .paginate(page=page, per_page=current_app.config['ARCHIVED_VACANCIES_PER_PAGE'], error_out=False))
+
+    # Applicant counts for the page, counted on demand from the archive
+    vacancy_ids = [vacancy.id for vacancy in pagination.items]
+    counts = dict(db.session.query(ArchivedApplication.vacancy_id, db.func.count(ArchivedApplication.id))
+                  .filter(ArchivedApplication.vacancy_id.in_(vacancy_ids))
+                  .group_by(ArchivedApplication.vacancy_id)
+                  .all()) if vacancy_ids else {}
+    return render_template('archived_vacancies.html', vacancies=pagination.items, counts=counts, pagination=pagination)
+
+@vacancy_bp.route('/company/vacancies/archived/<int:vacancy_id>')
+@read_replica
+@login_required
+def archived_vacancy_applications(vacancy_id):
+    if current_user.role != 'company':
+        flash('Access denied!', 'danger')
+        return redirect(url_for('auth.index'))
+
+    vacancy = ArchivedVacancy.query.get_or_404(vacancy_id)
+    if vacancy.company_id != current_user.id:
+        flash('This vacancy does not belong to your company.', 'danger')
+        return redirect(url_for('vacancy.archived_vacancies'))
 
-    # Fetch all available vacancies
-    vacancies = Vacancy.query.all()
-    return render_template('student_vacancies.html', vacancies=vacancies)
+    applications = (ArchivedApplication.query
+                    .filter_by(vacancy_id=vacancy.id)
+                    .options(db.joinedload(ArchivedApplication.student))
+                    .order_by(ArchivedApplication.applied_date)
+                    .all())
+    return render_template('archived_applications.html', vacancy=vacancy, applications=applications)
 
 # --------------------------------------------------------------
-@app.route('/student/apply/<int:vacancy_id>', methods=['POST'])
+@student_bp.route('/student/apply/<int:vacancy_id>', methods=['POST'])
 @login_required
 def apply_vacancy(vacancy_id):
     if current_user.role != 'student':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
-    # Check if the student has already applied for the vacancy
-    existing_application = Application.query.filter_by(vacancy_id=vacancy_id, student_id=current_user.id).first()
-    if existing_application:
+    # Primary-key lookup: the vacancy must still be live and open
+    is_open = db.session.query(Vacancy.id).filter(Vacancy.id == vacancy_id, Vacancy.last_date >= datetime.utcnow()).first()
+    if is_open is None:
+        flash('This vacancy is closed for applications.', 'warning')
+        return redirect(url_for('vacancy.student_vacancies'))
+
+    # Create a new application with "Pending" status unless the student already applied
+    if not insert_application(current_user.id, vacancy_id):
+        db.session.rollback()
         flash('You have already applied for this vacancy!', 'warning')
-        return redirect(url_for('student_vacancies'))
+        return redirect(url_for('vacancy.student_vacancies'))
 
-    # Create a new application with "Pending" status
-    application = Application(student_id=current_user.id, vacancy_id=vacancy_id, status='Pending')
-    db.session.add(application)
+    adjust_application_stats(vacancy_id, {'total': 1, 'pending': 1})
+    forget_dashboard(current_user.id, db.session)  # the vacancy drops out of the recommendations
     db.session.commit()
 
     flash('Applied successfully! Your status is now pending.', 'success')
-    return redirect(url_for('student_vacancies'))
+    return redirect(url_for('vacancy.student_vacancies'))
 
 # -------------------------------------------------------------------------------
-@app.route('/student/applied_vacancies')
+@student_bp.route('/student/applied_vacancies')
+@read_replica
 @login_required
 def applied_vacancies():
     if current_user.role != 'student':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     # Fetch all applications by the logged-in student
     applications = Application.query.filter_by(student_id=current_user.id).all()
     return render_template('applied_vacancies.html', applications=applications)
 
 # ----------------------------------------------------------------------------------
-@app.route('/company/view_applications')
+default_config['APPLICATIONS_PER_PAGE'] = 50
+
+# Sort keys accepted by view_applications; id is the tie-breaker so pages are stable
+APPLICATION_SORT_COLUMNS = {
+    'applied_date': Application.applied_date,
+    'status': Application.status,
+}
+
+@company_bp.route('/company/view_applications')
 @login_required
 def view_applications():
     if current_user.role != 'company':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
-
-    # Get all vacancies created by the company
-    vacancies = Vacancy.query.filter_by(company_id=current_user.id).all()
-
-    # Retrieve all applications for these vacancies
-    applications = []
-    for vacancy in vacancies:
-        vacancy_applications = Application.query.filter_by(vacancy_id=vacancy.id).all()
-        applications.extend(vacancy_applications)
+        return redirect(url_for('auth.index'))
+
+    sort = request.args.get('sort', 'applied_date')
+    if sort not in APPLICATION_SORT_COLUMNS:
+        sort = 'applied_date'
+    order = 'asc' if request.args.get('order') == 'asc' else 'desc'
+    page = request.args.get('page', 1, type=int)
+
+    # One joined query for all applications to this company's vacancies; the vacancy
+    # and student are loaded in the same statement so the template never lazy-loads.
+    column = APPLICATION_SORT_COLUMNS[sort]
+    ordering = [column.asc(), Application.id.asc()] if order == 'asc' else [column.desc(), Application.id.desc()]
+    query = (Application.query
+             .join(Application.vacancy)
+             .filter(Vacancy.company_id == current_user.id)
+             .options(db.contains_eager(Application.vacancy), db.joinedload(Application.student))
+             .order_by(*ordering))
+    pagination = query.paginate(page=page, per_page=current_app.config['APPLICATIONS_PER_PAGE'], error_out=False)
+
+    # Resumes of every applicant on this page, fetched in one query
+    resumes = {}
+    student_ids = {application.student_id for application in pagination.items}
+    if student_ids:
+        for resume in Resume.query.filter(Resume.user_id.in_(student_ids)).order_by(Resume.id):
+            resumes.setdefault(resume.user_id, []).append(resume)
 
     # Render the applications with student details
-    return render_template('view_applications.html', applications=applications)
-
-
-@app.route('/company/update_application_status/<int:application_id>', methods=['GET', 'POST'])
+    return render_template('view_applications.html', applications=pagination.items, resumes=resumes,
+                           pagination=pagination, sort=sort, order=order)
+
+
+# ==================== notification outbox ==============================================
+# Status changes write a notification_outbox row in the same commit as the change, so a
+# notification is queued if and only if the change is saved. `flask send-notifications`
+# is the worker: it claims due rows in batches, sends them over one SMTP connection per
+# batch at no more than NOTIFICATION_RATE_LIMIT messages a second, and retries failures
+# with exponential backoff. For local runs point MAIL_SERVER/MAIL_PORT at a stand-in such
+# as `python -m aiosmtpd -n -l localhost:1025`.
+default_config['MAIL_SERVER'] = os.environ.get('MAIL_SERVER', 'localhost')
+default_config['MAIL_PORT'] = int(os.environ.get('MAIL_PORT', 1025))
+default_config['MAIL_USERNAME'] = os.environ.get('MAIL_USERNAME')
+default_config['MAIL_PASSWORD'] = os.environ.get('MAIL_PASSWORD')
+default_config['MAIL_USE_TLS'] = os.environ.get('MAIL_USE_TLS', '0') == '1'
+default_config['MAIL_DEFAULT_SENDER'] = os.environ.get('MAIL_DEFAULT_SENDER', 'no-reply@jobcare.com')
+default_config['NOTIFICATION_BATCH_SIZE'] = 100
+default_config['NOTIFICATION_RATE_LIMIT'] = float(os.environ.get('NOTIFICATION_RATE_LIMIT', 10))  # messages per second
+default_config['NOTIFICATION_MAX_ATTEMPTS'] = 5
+default_config['NOTIFICATION_RETRY_BASE'] = 30  # seconds, doubled after every failed attempt
+default_config['NOTIFICATION_CLAIM_SECONDS'] = 300  # a crashed worker's batch is retried after this
+default_config['NOTIFICATION_POLL_INTERVAL'] = 5  # seconds between polls when the outbox is empty
+
+mail = Mail()
+
+class NotificationOutbox(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    student_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    vacancy_title = db.Column(db.String(100), nullable=False)
+    status = db.Column(db.String(20), nullable=False)
+    created_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    attempts = db.Column(db.Integer, nullable=False, default=0)
+    next_attempt_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    claim_token = db.Column(db.String(32), index=True)
+    sent_at = db.Column(db.DateTime)
+    last_error = db.Column(db.String(255))
+
+    # The worker's "what is due" scan: unsent rows ordered by next attempt
+    __table_args__ = (
+        db.Index('ix_notification_outbox_due', 'sent_at', 'next_attempt_at'),
+    )
+
+def enqueue_status_notification(application, status):
+    db.session.add(NotificationOutbox(student_id=application.student_id,
+                                      vacancy_title=application.vacancy.title, status=status))
+
+# Queue one notification per application matched by `application_filter` in a single
+# INSERT ... SELECT, for status changes that touch many applications at once
+def enqueue_status_notifications(application_filter, status):
+    now = datetime.utcnow()
+    rows = (db.select(Application.student_id, Vacancy.title, db.literal(status), db.literal(now), db.literal(0), db.literal(now))
+            .join(Vacancy, Application.vacancy_id == Vacancy.id)
+            .where(application_filter))
+    return db.session.execute(db.insert(NotificationOutbox).from_select(
+        ['student_id', 'vacancy_title', 'status', 'created_at', 'attempts', 'next_attempt_at'], rows)).rowcount
+
+def status_notification_message(notification, recipient):
+    return Message(
+        subject=f'Your application for {notification.vacancy_title}',
+        recipients=[recipient],
+        body=(f'Hello,\n\nThe status of your application for "{notification.vacancy_title}" '
+              f'is now: {notification.status}.\n\nJobcare'),
+    )
+
+# Lease up to `limit` due notifications to this worker; other workers skip them until
+# the claim expires
+def claim_notifications(limit):
+    now = datetime.utcnow()
+    due = (db.session.query(NotificationOutbox.id)
+           .filter(NotificationOutbox.sent_at.is_(None),
+                   NotificationOutbox.next_attempt_at <= now,
+                   NotificationOutbox.attempts < current_app.config['NOTIFICATION_MAX_ATTEMPTS'])
+           .order_by(NotificationOutbox.next_attempt_at, NotificationOutbox.id)
+           .limit(limit))
+    ids = [row[0] for row in due]
+    if not ids:
+        return []
+    token = os.urandom(16).hex()
+    db.session.execute(
+        db.update(NotificationOutbox)
+        .where(NotificationOutbox.id.in_(ids), NotificationOutbox.sent_at.is_(None), NotificationOutbox.next_attempt_at <= now)
+        .values(claim_token=token, next_attempt_at=now + timedelta(seconds=current_app.config['NOTIFICATION_CLAIM_SECONDS']))
+    )
+    db.session.commit()
+    return NotificationOutbox.query.filter_by(claim_token=token).order_by(NotificationOutbox.id).all()
+
+def record_failure(notification, error):
+    notification.attempts += 1
+    notification.last_error = str(error)[:255]
+    notification.next_attempt_at = datetime.utcnow() + timedelta(seconds=current_app.config['NOTIFICATION_RETRY_BASE'] * 2 ** (notification.attempts - 1))
+
+# Send one claimed batch; returns (sent, failed)
+def send_notification_batch(limit=None):
+    notifications = claim_notifications(limit or current_app.config['NOTIFICATION_BATCH_SIZE'])
+    if not notifications:
+        return 0, 0
+    recipients = dict(db.session.query(User.id, User.email).filter(User.id.in_({n.student_id for n in notifications})))
+    interval = 1.0 / current_app.config['NOTIFICATION_RATE_LIMIT'] if current_app.config['NOTIFICATION_RATE_LIMIT'] > 0 else 0
+    sent = failed = 0
+    try:
+        with mail.connect() as connection:
+            next_send = time.monotonic()
+            for notification in notifications:
+                delay = next_send - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                next_send = time.monotonic() + interval
+                try:
+                    connection.send(status_notification_message(notification, recipients[notification.student_id]))
+                    notification.sent_at = datetime.utcnow()
+                    sent += 1
+                except Exception as error:
+                    record_failure(notification, error)
+                    failed += 1
+    except Exception as error:  # could not reach the SMTP server at all
+        current_app.logger.warning('Notification batch failed: %s', error)
+        for notification in notifications:
+            if notification.sent_at is None:
+                record_failure(notification, error)
+        failed = len(notifications) - sent
+    for notification in notifications:
+        notification.claim_token = None
+    db.session.commit()
+    return sent, failed
+
+@ops_bp.cli.command('send-notifications')
+@click.option('--once', is_flag=True, help='Drain the outbox and exit instead of polling.')
+def send_notifications_command(once):
+    while True:
+        sent, failed = send_notification_batch()
+        if sent or failed:
+            print(f'Sent {sent} notifications, {failed} failed.')
+        elif once:
+            break
+        else:
+            time.sleep(current_app.config['NOTIFICATION_POLL_INTERVAL'])
+
+@ops_bp.route('/ops/notification_stats')
+def notification_stats_view():
+    require_ops_access()
+    max_attempts = current_app.config['NOTIFICATION_MAX_ATTEMPTS']
+    pending, dead, sent = db.session.query(
+        db.func.coalesce(db.func.sum(db.case(((NotificationOutbox.sent_at.is_(None)) & (NotificationOutbox.attempts < max_attempts), 1), else_=0)), 0),
+        db.func.coalesce(db.func.sum(db.case(((NotificationOutbox.sent_at.is_(None)) & (NotificationOutbox.attempts >= max_attempts), 1), else_=0)), 0),
+        db.func.count(NotificationOutbox.sent_at),
+    ).one()
+    return jsonify(pending=pending, failed=dead, sent=sent)
+
+@company_bp.route('/company/update_application_status/<int:application_id>', methods=['GET', 'POST'])
 @login_required
 def update_application_status(application_id):
     if current_user.role != 'company':
         flash('Access denied!', 'danger')
-        return redirect(url_for('index'))
+        return redirect(url_for('auth.index'))
 
     application = Application.query.get_or_404(application_id)
+    if application.vacancy.company_id != current_user.id:
+        flash('This application is not for one of your vacancies.', 'danger')
+        return redirect(url_for('company.view_applications'))
 
     if request.method == 'POST':
         # Here, you'll handle the form submission to update the status
-        new_status = request.form['status']  # assuming you're using a form with a 'status' field
+        new_status = request.form.get('status')  # assuming you're using a form with a 'status' field
+        if new_status not in STATUS_COUNTERS:
+            flash('Choose a valid status.', 'danger')
+            return redirect(url_for('company.update_application_status', application_id=application.id))
+        adjust_application_stats(application.vacancy_id, status_change_delta(application.status, new_status))
+        if new_status != application.status:
+            enqueue_status_notification(application, new_status)  # sent by the outbox worker
         application.status = new_status
         db.session.commit()
         flash(f'Application status updated to {new_status}!', 'success')
-        return redirect(url_for('view_applications'))  # Redirect back to the view applications page
+        return redirect(url_for('company.view_applications'))  # Redirect back to the view applications page
 
     return render_template('update_application_status.html', application=application)
 
+# Set the status of many applications to one vacancy at once: either the ids posted as
+# application_ids, or every Pending application when all_pending is set. Counters,
+# notifications and the status change are each one set-based statement.
+@company_bp.route('/company/vacancies/<int:vacancy_id>/applications/status', methods=['POST'])
+@login_required
+def bulk_update_application_status(vacancy_id):
+    if current_user.role != 'company':
+        flash('Access denied!', 'danger')
+        return redirect(url_for('auth.index'))
+
+    vacancy = Vacancy.query.get_or_404(vacancy_id)
+    if vacancy.company_id != current_user.id:
+        flash('This vacancy does not belong to your company.', 'danger')
+        return redirect(url_for('vacancy.view_company_vacancies'))
+
+    new_status = request.form.get('status')
+    if new_status not in STATUS_COUNTERS:
+        flash('Choose a valid status.', 'danger')
+        return redirect(url_for('vacancy.view_company_vacancies'))
+
+    # Rows already in the new status are left alone, so they are neither counted nor notified
+    matches = (Application.vacancy_id == vacancy.id) & (Application.status != new_status)
+    if request.form.get('all_pending'):
+        matches &= Application.status == 'Pending'
+    else:
+        application_ids = {int(value) for value in request.form.getlist('application_ids') if value.isdigit()}
+        if not application_ids:
+            flash('Select at least one application.', 'warning')
+            return redirect(url_for('vacancy.view_company_vacancies'))
+        matches &= Application.id.in_(application_ids)
+
+    # Counter delta from the statuses being replaced; reconcile_application_stats()
+    # repairs the counters if a concurrent single update slips in between
+    delta = {}
+    changed = 0
+    for old_status, count in db.session.query(Application.status, db.func.count(Application.id)).filter(matches).group_by(Application.status):
+        changed += count
+        for column, amount in status_change_delta(old_status, new_status).items():
+            delta[column] = delta.get(column, 0) + amount * count
+
+    if changed:
+        enqueue_status_notifications(matches, new_status)
+        db.session.execute(db.update(Application).where(matches).values(status=new_status).execution_options(synchronize_session=False))
+        adjust_application_stats(vacancy.id, delta)
+        db.session.commit()
+
+    flash(f'{changed} applications set to {new_status}.', 'success')
+    return redirect(url_for('vacancy.view_company_vacancies'))
+
+# ==================== JSON API v1 ==============================================
+# Read API for the mobile client under /api/v1. It uses the same session cookie as the
+# site (POST /api/v1/login to get one). Every endpoint accepts ?fields=a,b to return
+# only those fields. Lists are cursor-paginated ({"data": [...], "next_cursor": ...}),
+# and every response carries a weak ETag so If-None-Match revalidation gets a 304.
+default_config['API_PAGE_SIZE'] = 20
+default_config['API_MAX_PAGE_SIZE'] = 100
+
+def api_datetime(value):
+    return value.isoformat() if value else None
+
+VACANCY_API_FIELDS = {
+    'id': lambda vacancy: vacancy.id,
+    'company_id': lambda vacancy: vacancy.company_id,
+    'title': lambda vacancy: vacancy.title,
+    'description': lambda vacancy: vacancy.description,
+    'location': lambda vacancy: vacancy.location,
+    'posted_date': lambda vacancy: api_datetime(vacancy.posted_date),
+    'last_date': lambda vacancy: api_datetime(vacancy.last_date),
+    'updated_at': lambda vacancy: api_datetime(vacancy.updated_at),
+}
+APPLICATION_API_FIELDS = {
+    'id': lambda application: application.id,
+    'vacancy_id': lambda application: application.vacancy_id,
+    'vacancy_title': lambda application: application.vacancy.title,
+    'student_id': lambda application: application.student_id,
+    'status': lambda application: application.status,
+    'applied_date': lambda application: api_datetime(application.applied_date),
+}
+PROFILE_API_FIELDS = {
+    'id': lambda user: user.id,
+    'username': lambda user: user.username,
+    'email': lambda user: user.email,
+    'role': lambda user: user.role,
+    'full_name': lambda user: user.profile.full_name if user.profile else None,
+    'bio': lambda user: user.profile.bio if user.profile else None,
+    'profile_pic': lambda user: profile_pic_url(user.profile.profile_pic) if user.profile and user.profile.profile_pic else None,
+    'education': lambda user: user.student_details.education if user.student_details else None,
+    'skills': lambda user: user.student_details.skills if user.student_details else None,
+    'contact': lambda user: user.student_details.contact if user.student_details else None,
+    'address': lambda user: user.student_details.address if user.student_details else None,
+}
+RESUME_API_FIELDS = {
+    'id': lambda resume: resume.id,
+    'filename': lambda resume: resume.filename,
+    'uploaded_at': lambda resume: api_datetime(resume.uploaded_at),
+    'url': lambda resume: url_for('resume.serve_resume', resume_id=resume.id),
+}
+
+class APIError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+@api_bp.errorhandler(APIError)
+def handle_api_error(error):
+    return jsonify(error=error.message), error.status
+
+def api_login_required(view):
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        if not current_user.is_authenticated:
+            raise APIError(401, 'Login required.')
+        return view(*args, **kwargs)
+    return wrapper
+
+def api_require_role(*roles):
+    if current_user.role not in roles:
+        raise APIError(403, 'Access denied.')
+
+# The getters named by ?fields=, all of them by default
+def api_fields(available):
+    requested = request.args.get('fields')
+    if not requested:
+        return available
+    names = [name.strip() for name in requested.split(',') if name.strip()]
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise APIError(400, f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(available)}.")
+    return {name: available[name] for name in names}
+
+def api_serialize(obj, fields):
+    return {name: getter(obj) for name, getter in fields.items()}
+
+def api_page_size():
+    return max(1, min(request.args.get('limit', current_app.config['API_PAGE_SIZE'], type=int), current_app.config['API_MAX_PAGE_SIZE']))
+
+def encode_id_cursor(row_id):
+    return base64.urlsafe_b64encode(str(row_id).encode('ascii')).decode('ascii')
+
+def decode_id_cursor(cursor):
+    try:
+        return int(base64.urlsafe_b64decode(cursor.encode('ascii')).decode('ascii'))
+    except (ValueError, UnicodeError):
+        raise APIError(400, 'Invalid cursor.')
+
+# Compact JSON with a weak ETag; answers 304 when the client already has this body
+def api_response(payload):
+    response = jsonify(payload)
+    response.add_etag(weak=True)
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+@api_bp.route('/api/v1/login', methods=['POST'])
+def api_login():
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise APIError(400, 'Send a JSON object with email and password.')
+    email, password = data.get('email', ''), data.get('password', '')
+    if not isinstance(email, str) or not isinstance(password, str):
+        raise APIError(400, 'email and password must be strings.')
+    user = User.query.filter_by(email=email).first()
+    if not user or not password_hasher.check_password_hash(user.password, password):
+        raise APIError(401, 'Invalid email or password.')
+    login_user(user)
+    return jsonify(id=user.id, username=user.username, role=user.role)
+
+@api_bp.route('/api/v1/vacancies')
+@read_replica
+@api_login_required
+def api_vacancies():
+    fields = api_fields(VACANCY_API_FIELDS)
+    limit = api_page_size()
+    query = Vacancy.query.filter(Vacancy.last_date >= datetime.utcnow())
+    if request.args.get('location'):
+        query = query.filter(Vacancy.location == request.args['location'])
+    if request.args.get('cursor'):
+        position = decode_vacancy_cursor(request.args['cursor'])
+        if position is None:
+            raise APIError(400, 'Invalid cursor.')
+        query = query.filter(db.tuple_(Vacancy.posted_date, Vacancy.id) < position)
+
+    vacancies = query.order_by(Vacancy.posted_date.desc(), Vacancy.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_vacancy_cursor(vacancies[limit - 1]) if len(vacancies) > limit else None
+    return api_response({'data': [api_serialize(vacancy, fields) for vacancy in vacancies[:limit]], 'next_cursor': next_cursor})
+
+@api_bp.route('/api/v1/vacancies/<int:vacancy_id>')
+@read_replica
+@api_login_required
+def api_vacancy(vacancy_id):
+    fields = api_fields(VACANCY_API_FIELDS)
+    vacancy = db.session.get(Vacancy, vacancy_id)
+    if vacancy is None:
+        raise APIError(404, 'Vacancy not found.')
+    return api_response(api_serialize(vacancy, fields))
+
+# Students see their own applications, companies the applications to their vacancies
+def api_applications_query():
+    query = Application.query.join(Application.vacancy).options(db.contains_eager(Application.vacancy))
+    if current_user.role == 'student':
+        return query.filter(Application.student_id == current_user.id)
+    api_require_role('company')
+    return query.filter(Vacancy.company_id == current_user.id)
+
+@api_bp.route('/api/v1/applications')
+@read_replica
+@api_login_required
+def api_applications():
+    fields = api_fields(APPLICATION_API_FIELDS)
+    limit = api_page_size()
+    query = api_applications_query()
+    if request.args.get('vacancy_id', type=int):
+        query = query.filter(Application.vacancy_id == request.args.get('vacancy_id', type=int))
+    if request.args.get('cursor'):
+        query = query.filter(Application.id < decode_id_cursor(request.args['cursor']))
+
+    applications = query.order_by(Application.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_id_cursor(applications[limit - 1].id) if len(applications) > limit else None
+    return api_response({'data': [api_serialize(application, fields) for application in applications[:limit]], 'next_cursor': next_cursor})
+
+@api_bp.route('/api/v1/applications/<int:application_id>')
+@read_replica
+@api_login_required
+def api_application(application_id):
+    fields = api_fields(APPLICATION_API_FIELDS)
+    application = api_applications_query().filter(Application.id == application_id).first()
+    if application is None:
+        raise APIError(404, 'Application not found.')
+    return api_response(api_serialize(application, fields))
+
+@api_bp.route('/api/v1/profile')
+@read_replica
+@api_login_required
+def api_profile():
+    fields = api_fields(PROFILE_API_FIELDS)
+    user = (User.query
+            .options(db.joinedload(User.profile), db.joinedload(User.student_details))
+            .filter(User.id == current_user.id)
+            .one())
+    return api_response(api_serialize(user, fields))
+
+@api_bp.route('/api/v1/resumes')
+@read_replica
+@api_login_required
+def api_resumes():
+    api_require_role('student')
+    fields = api_fields(RESUME_API_FIELDS)
+    limit = api_page_size()
+    query = Resume.query.filter(Resume.user_id == current_user.id)
+    if request.args.get('cursor'):
+        query = query.filter(Resume.id < decode_id_cursor(request.args['cursor']))
+
+    resumes = query.order_by(Resume.id.desc()).limit(limit + 1).all()
+    next_cursor = encode_id_cursor(resumes[limit - 1].id) if len(resumes) > limit else None
+    return api_response({'data': [api_serialize(resume, fields) for resume in resumes[:limit]], 'next_cursor': next_cursor})
+
+@api_bp.route('/api/v1/resumes/<int:resume_id>')
+@read_replica
+@api_login_required
+def api_resume(resume_id):
+    fields = api_fields(RESUME_API_FIELDS)
+    resume = db.session.get(Resume, resume_id)
+    if resume is None or not can_view_resume(resume):
+        raise APIError(404, 'Resume not found.')
+    return api_response(api_serialize(resume, fields))
+
 # ========================================================================================
+#                              create_app
+# ========================================================================================
+# `flask --app app ...` and gunicorn ('app:create_app()') find the factory by name.
+# Keyword overrides win over default_config, e.g. create_app({'TESTING': True}).
+def create_app(config=None):
+    app = Flask(__name__)
+    app.config.update(default_config)
+    app.config.update(config or {})
+    app.config.setdefault('SQLALCHEMY_BINDS', {f'replica_{index}': url for index, url in enumerate(app.config['DATABASE_REPLICA_URLS'])})
+    if not app.config['SQLALCHEMY_DATABASE_URI'].startswith('sqlite'):
+        app.config.setdefault('SQLALCHEMY_ENGINE_OPTIONS', dict(DATABASE_POOL_OPTIONS))
+
+    db.init_app(app)
+    bcrypt.init_app(app)
+    login_manager.init_app(app)
+    mail.init_app(app)
+    app.cli.add_command(MigrationCommands('db', help='Perform database migrations.'))
+
+    # Per app and per process, shared by every request the app serves
+    app.extensions['caches'] = {
+        'user': TTLCache(app.config['USER_CACHE_SIZE'], app.config['USER_CACHE_TTL']),
+        'dashboard': TTLCache(app.config['DASHBOARD_CACHE_SIZE'], app.config['DASHBOARD_CACHE_TTL']),
+        'fragment': new_fragment_cache(app.config),
+        'corpus_size': TTLCache(8, 60),
+    }
+    os.makedirs(app.config['RESUME_UPLOAD_FOLDER'], exist_ok=True)
+
+    app.view_functions['static'] = send_static_asset
+    for blueprint in BLUEPRINTS:
+        app.register_blueprint(blueprint)
+    return app
+
+# Modules that request code imports on first use; the thumbnail and resume pools need the
+# last two, and the resume pool's processes inherit them when forked from a warm worker
+WARM_UP_MODULES = ['numpy', 'pypdf', 'PIL.Image', 'PIL.ImageOps']
+
+# Work that can be shared across fork(): import the lazily imported modules, configure the
+# mappers, compile every template and read the asset manifest. gunicorn.conf.py runs this
+# in the master after preloading the app, so forked workers start warm. It opens no
+# database connection, thread or pool.
+def warm_up(app):
+    for module in WARM_UP_MODULES:
+        importlib.import_module(module)
+    configure_mappers()
+    for name in app.jinja_env.list_templates(extensions=['html']):
+        app.jinja_env.get_template(name)
+    with app.app_context():
+        load_asset_manifest()
+
+# Run in each worker right after fork. Connections the master may have opened must not be
+# shared, so they are dropped from the worker's pools without being closed.
+def init_worker(app):
+    with app.app_context():
+        for engine in db.engines.values():
+            engine.dispose(close=False)
 
 
 if __name__ == '__main__':
+    app = create_app()
     with app.app_context():
-        db.create_all()
+        upgrade_database(app)
     app.run(debug=True)
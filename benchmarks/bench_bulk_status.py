@@ -0,0 +1,98 @@
+# ===========================================================================================
+#        Benchmark: bulk application status update vs one request per application
+# ===========================================================================================
+# Seeds one vacancy with --applicants Pending applications in a throwaway SQLite
+# database, then closes the hiring round twice: once through the per-application form
+# (GET + POST /company/update_application_status/<id> for every row) and once with a
+# single POST to the bulk endpoint. Both runs must end with the same statuses, counters
+# and notification count.
+#
+#   python benchmarks/bench_bulk_status.py --applicants 2000
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+
+def seed(app_module, db, applicants):
+    password = app_module.bcrypt.generate_password_hash('bench').decode('utf-8')
+    company = app_module.User(username='company', email='company@bench.test', password=password, role='company')
+    db.session.add(company)
+    db.session.flush()
+    students = [app_module.User(username=f'student{i}', email=f'student{i}@bench.test', password=password, role='student')
+                for i in range(applicants)]
+    db.session.add_all(students)
+    vacancies = [app_module.Vacancy(company_id=company.id, title=f'Round {run}', description='Bulk status benchmark',
+                                    location='Pune', last_date=datetime.utcnow() + timedelta(days=30))
+                 for run in ('loop', 'bulk')]
+    db.session.add_all(vacancies)
+    db.session.flush()
+    for vacancy in vacancies:
+        db.session.add_all([app_module.Application(student_id=student.id, vacancy_id=vacancy.id, status='Pending')
+                            for student in students])
+    app_module.create_application_stats([vacancy.id for vacancy in vacancies])
+    db.session.flush()
+    app_module.reconcile_application_stats()
+    return [vacancy.id for vacancy in vacancies]
+
+
+def check(app_module, db, vacancy_id, applicants):
+    Application = app_module.Application
+    rejected = Application.query.filter_by(vacancy_id=vacancy_id, status='Rejected').count()
+    stats = db.session.get(app_module.VacancyApplicationStats, vacancy_id)
+    return rejected == applicants and stats.rejected == applicants and stats.pending == 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare bulk and per-row application status updates.')
+    parser.add_argument('--applicants', type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='jobcare-bench-')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(workdir, 'bench.db')
+    os.environ.setdefault('BCRYPT_LOG_ROUNDS', '4')
+    os.environ.setdefault('PASSWORD_HASH_WORKERS', '0')
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import app as app_module
+
+    app, db = app_module.create_app(), app_module.db
+    with app.app_context():
+        db.create_all()
+        loop_vacancy, bulk_vacancy = seed(app_module, db, args.applicants)
+        loop_ids = [row[0] for row in db.session.query(app_module.Application.id).filter_by(vacancy_id=loop_vacancy)]
+
+    client = app.test_client()
+    client.post('/login', data={'email': 'company@bench.test', 'password': 'bench'})
+
+    started = time.perf_counter()
+    for application_id in loop_ids:
+        client.get(f'/company/update_application_status/{application_id}')
+        client.post(f'/company/update_application_status/{application_id}', data={'status': 'Rejected'})
+    loop_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    response = client.post(f'/company/vacancies/{bulk_vacancy}/applications/status',
+                           data={'status': 'Rejected', 'all_pending': '1'})
+    bulk_seconds = time.perf_counter() - started
+
+    with app.app_context():
+        loop_ok = check(app_module, db, loop_vacancy, args.applicants)
+        bulk_ok = check(app_module, db, bulk_vacancy, args.applicants)
+        queued = app_module.NotificationOutbox.query.count()
+
+    print(f'applicants: {args.applicants}')
+    print(f'per-row loop: {2 * len(loop_ids)} requests in {loop_seconds:.2f}s '
+          f'({loop_seconds * 1000 / max(len(loop_ids), 1):.2f} ms per application)')
+    print(f'bulk update:  1 request in {bulk_seconds * 1000:.1f} ms  ({loop_seconds / bulk_seconds:.0f}x faster)')
+    print(f'notifications queued: {queued} (expected {2 * args.applicants})')
+
+    if response.status_code != 302 or not loop_ok or not bulk_ok or queued != 2 * args.applicants:
+        print('FAILED')
+        sys.exit(1)
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
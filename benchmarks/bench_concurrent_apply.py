@@ -0,0 +1,116 @@
+# ===========================================================================================
+#        Load test: concurrent duplicate applies must leave exactly one application
+# ===========================================================================================
+# For each vacancy, fires --concurrency simultaneous POST /student/apply/<id> requests
+# from the same student (the double-click case) against a throwaway SQLite database,
+# then checks there is exactly one application row and an application count of 1.
+# Reports per-request latency so regressions in the apply path show up.
+#
+#   python benchmarks/bench_concurrent_apply.py --vacancies 50 --concurrency 8
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fire concurrent duplicate applies and check for duplicates.')
+    parser.add_argument('--vacancies', type=int, default=50)
+    parser.add_argument('--concurrency', type=int, default=8)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='jobcare-bench-')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(workdir, 'bench.db')
+    os.environ.setdefault('BCRYPT_LOG_ROUNDS', '4')
+    os.environ.setdefault('PASSWORD_HASH_WORKERS', '0')
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import app as app_module
+
+    app, db = app_module.create_app(), app_module.db
+    with app.app_context():
+        db.create_all()
+        password = app_module.bcrypt.generate_password_hash('bench').decode('utf-8')
+        company = app_module.User(username='company', email='company@bench.test', password=password, role='company')
+        student = app_module.User(username='student', email='student@bench.test', password=password, role='student')
+        db.session.add_all([company, student])
+        db.session.flush()
+        vacancies = [
+            app_module.Vacancy(company_id=company.id, title=f'Vacancy {i}', description='Load test vacancy',
+                               location='Pune', last_date=datetime.utcnow() + timedelta(days=30))
+            for i in range(args.vacancies)
+        ]
+        db.session.add_all(vacancies)
+        db.session.flush()
+        app_module.create_application_stats([vacancy.id for vacancy in vacancies])
+        db.session.commit()
+        student_id = student.id
+        vacancy_ids = [vacancy.id for vacancy in vacancies]
+
+    # One logged-in client per thread
+    clients = []
+    for _ in range(args.concurrency):
+        client = app.test_client()
+        client.post('/login', data={'email': 'student@bench.test', 'password': 'bench'})
+        clients.append(client)
+
+    latencies = []
+    failures = []
+    lock = threading.Lock()
+
+    def apply(client, vacancy_id, barrier):
+        barrier.wait()
+        started = time.perf_counter()
+        response = client.post(f'/student/apply/{vacancy_id}')
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        with lock:
+            latencies.append(elapsed_ms)
+            if response.status_code != 302:
+                failures.append((vacancy_id, response.status_code))
+
+    started = time.perf_counter()
+    for vacancy_id in vacancy_ids:
+        barrier = threading.Barrier(args.concurrency)
+        threads = [threading.Thread(target=apply, args=(client, vacancy_id, barrier)) for client in clients]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    wall_seconds = time.perf_counter() - started
+
+    with app.app_context():
+        Application = app_module.Application
+        duplicates = (db.session.query(Application.vacancy_id, db.func.count(Application.id))
+                      .filter(Application.student_id == student_id)
+                      .group_by(Application.vacancy_id)
+                      .having(db.func.count(Application.id) != 1)
+                      .all())
+        applied = db.session.query(db.func.count(Application.id)).filter(Application.student_id == student_id).scalar()
+        bad_counters = (app_module.VacancyApplicationStats.query
+                        .filter(app_module.VacancyApplicationStats.vacancy_id.in_(vacancy_ids),
+                                app_module.VacancyApplicationStats.total != 1)
+                        .count())
+
+    print(f'vacancies: {args.vacancies}  concurrent requests per vacancy: {args.concurrency}')
+    print(f'requests: {len(latencies)}  failed: {len(failures)}  wall time: {wall_seconds:.2f}s')
+    print(f'latency ms  p50: {percentile(latencies, 0.50):.2f}  p95: {percentile(latencies, 0.95):.2f}  '
+          f'p99: {percentile(latencies, 0.99):.2f}  stdev: {statistics.pstdev(latencies):.2f}')
+    print(f'application rows: {applied} (expected {args.vacancies})  duplicates: {len(duplicates)}  '
+          f'wrong counters: {bad_counters}')
+
+    if failures or duplicates or applied != args.vacancies or bad_counters:
+        print('FAILED')
+        sys.exit(1)
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# ===========================================================================================
+#        Benchmark: bulk vacancy import vs. one create_vacancy form post per row
+# ===========================================================================================
+# Drives both real routes through the Flask test client against a throwaway SQLite
+# database and reports rows/sec for each.
+#
+#   python benchmarks/bench_vacancy_import.py --rows 5000
+import argparse
+import csv
+import io
+import os
+import sys
+import tempfile
+import time
+
+
+def make_rows(count):
+    return [
+        {
+            'title': f'Backend Engineer {i}',
+            'description': f'Build and run Flask services, posting number {i}.',
+            'location': ('Pune', 'Delhi', 'Remote')[i % 3],
+            'last_date': '2099-12-31',
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare bulk vacancy import with per-row form posts.')
+    parser.add_argument('--rows', type=int, default=2000)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='jobcare-bench-')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(workdir, 'bench.db')
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import app as app_module
+
+    app = app_module.create_app()
+    with app.app_context():
+        app_module.db.create_all()
+        password = app_module.bcrypt.generate_password_hash('bench').decode('utf-8')
+        app_module.db.session.add(app_module.User(username='bench', email='bench@company.test', password=password, role='company'))
+        app_module.db.session.commit()
+
+    client = app.test_client()
+    client.post('/login', data={'email': 'bench@company.test', 'password': 'bench'})
+    rows = make_rows(args.rows)
+
+    started = time.perf_counter()
+    for row in rows:
+        client.post('/company/create_vacancy', data=row)
+    single_seconds = time.perf_counter() - started
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=['title', 'description', 'location', 'last_date'])
+    writer.writeheader()
+    writer.writerows(rows)
+    body = buffer.getvalue()
+    started = time.perf_counter()
+    result = client.post('/company/vacancies/import', data=body, content_type='text/csv').get_json()
+    bulk_seconds = time.perf_counter() - started
+
+    print(f'rows: {args.rows}  batch size: {app.config["IMPORT_BATCH_SIZE"]}  imported: {result["inserted"]}')
+    print(f'create_vacancy per row : {args.rows / single_seconds:10.0f} rows/sec')
+    print(f'bulk import            : {args.rows / bulk_seconds:10.0f} rows/sec')
+    print(f'speedup                : {single_seconds / bulk_seconds:10.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+# ===========================================================================================
+#        Benchmark: indexed vacancy search vs. naive LIKE '%term%' scanning
+# ===========================================================================================
+# Seeds a throwaway SQLite database with synthetic vacancies and times the same
+# searches through the FTS5 backend and through LIKE filters on title/description.
+#
+#   python benchmarks/bench_vacancy_search.py --vacancies 50000 --queries 200
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+SKILLS = (
+    'python java flask django react sql data analyst engineer backend frontend cloud aws '
+    'devops marketing sales finance accounting design intern manager support testing qa '
+    'mobile android ios security network linux kotlin golang rust machine learning research'
+).split()
+CITIES = ['Delhi', 'Mumbai', 'Pune', 'Bengaluru', 'Hyderabad', 'Chennai', 'Jaipur', 'Remote']
+
+
+def make_vocabulary(rng, size=5000):
+    # Synthetic words with a Zipf-like frequency, so, as in real postings, a few words
+    # are everywhere and most are selective
+    letters = 'abcdefghijklmnopqrstuvwxyz'
+    words = SKILLS + [''.join(rng.choice(letters) for _ in range(rng.randint(4, 9))) for _ in range(size)]
+    weights = [1.0 / rank for rank in range(1, len(words) + 1)]
+    return words, weights
+
+
+def seed(app_module, count, rng, words, weights):
+    db, Vacancy, User = app_module.db, app_module.Vacancy, app_module.User
+    company = User(username='bench-company', email='bench@company.test', password='x', role='company')
+    db.session.add(company)
+    db.session.flush()
+
+    now = datetime.utcnow()
+    rows = [
+        {
+            'company_id': company.id,
+            'title': ' '.join(rng.sample(SKILLS, 3)).title(),
+            'description': ' '.join(rng.choices(words, weights, k=60)),
+            'location': rng.choice(CITIES),
+            'posted_date': now - timedelta(minutes=i),
+            'last_date': now + timedelta(days=rng.randint(1, 60)),
+        }
+        for i in range(count)
+    ]
+    db.session.execute(db.insert(Vacancy), rows)
+    app_module.vacancy_search().rebuild(db.session)
+    db.session.commit()
+
+
+def like_search(app_module, terms, now, limit):
+    Vacancy = app_module.Vacancy
+    query = app_module.Vacancy.query.filter(Vacancy.last_date >= now)
+    for term in terms:
+        pattern = f'%{term}%'
+        query = query.filter(Vacancy.title.ilike(pattern) | Vacancy.description.ilike(pattern))
+    return [vacancy.id for vacancy in query.order_by(Vacancy.posted_date.desc()).limit(limit)]
+
+
+def index_search(app_module, terms, now, limit):
+    return [hit[0] for hit in app_module.vacancy_search().search(app_module.db.session, terms, now, limit, 0)]
+
+
+def timed(func, queries):
+    started = time.perf_counter()
+    for query in queries:
+        func(query)
+    return (time.perf_counter() - started) / len(queries) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compare indexed vacancy search with LIKE scans.')
+    parser.add_argument('--vacancies', type=int, default=20000)
+    parser.add_argument('--queries', type=int, default=100)
+    parser.add_argument('--limit', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix='jobcare-bench-')
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(workdir, 'bench.db')
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import app as app_module
+
+    rng = random.Random(args.seed)
+    with app_module.create_app().app_context():
+        app_module.db.create_all()
+        words, weights = make_vocabulary(rng)
+        seed(app_module, args.vacancies, rng, words, weights)
+
+        now = datetime.utcnow()
+        # Search for words from the middle of the frequency distribution
+        queries = [rng.sample(words[200:2000], rng.randint(1, 2)) for _ in range(args.queries)]
+        like_ms = timed(lambda terms: like_search(app_module, terms, now, args.limit), queries)
+        index_ms = timed(lambda terms: index_search(app_module, terms, now, args.limit), queries)
+
+    print(f'vacancies: {args.vacancies}  queries: {args.queries}  page size: {args.limit}')
+    print(f'LIKE scan   : {like_ms:8.2f} ms/query')
+    print(f'FTS5 index  : {index_ms:8.2f} ms/query')
+    print(f'speedup     : {like_ms / index_ms:8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# ===========================================================================================
+#        Query-count check: view_applications must not grow with the number of rows
+# ===========================================================================================
+# Seeds two throwaway SQLite databases, one with N applications to a company's vacancies
+# and one with 10 x N, every applicant with a resume, and renders /company/view_applications
+# (all rows on one page) in each sort order. The page must issue the same fixed number
+# of statements for both datasets; a lazy load per row (the N+1 this route used to have)
+# makes the counts differ and the check exit non-zero.
+#
+#   python benchmarks/check_view_applications_queries.py --applications 20
+import argparse
+import os
+import sys
+import tempfile
+from datetime import datetime, timedelta
+
+VACANCIES = 5
+# (label, query string)
+VIEWS = [
+    ('newest', {}),
+    ('oldest', {'sort': 'applied_date', 'order': 'asc'}),
+    ('status', {'sort': 'status', 'order': 'asc'}),
+]
+
+
+# Returns how many of the applications are to the checked company's vacancies
+def seed(app_module, db, applications):
+    password = app_module.bcrypt.generate_password_hash('bench').decode('utf-8')
+    company = app_module.User(username='company', email='company@bench.test', password=password, role='company')
+    other = app_module.User(username='other', email='other@bench.test', password=password, role='company')
+    db.session.add_all([company, other])
+    db.session.flush()
+    vacancies = [
+        app_module.Vacancy(company_id=owner.id, title=f'Vacancy {i}', description='Query count check',
+                           location='Pune', last_date=datetime.utcnow() + timedelta(days=30))
+        for owner in (company, other) for i in range(VACANCIES)
+    ]
+    db.session.add_all(vacancies)
+    db.session.flush()
+    students = [app_module.User(username=f'student{i}', email=f'student{i}@bench.test', password=password, role='student')
+                for i in range(applications)]
+    db.session.add_all(students)
+    db.session.flush()
+    for i, student in enumerate(students):
+        db.session.add(app_module.Resume(user_id=student.id, filename=f'cv{i}.pdf'))
+        db.session.add(app_module.Application(student_id=student.id, vacancy_id=vacancies[i % len(vacancies)].id,
+                                              applied_date=datetime.utcnow() - timedelta(minutes=i)))
+    db.session.commit()
+    return sum(1 for i in range(applications) if i % len(vacancies) < VACANCIES)
+
+
+# {view label: [statements]} for one dataset of `applications` rows
+def statements_per_view(app_module, applications):
+    from sqlalchemy import event
+
+    db = app_module.db
+    workdir = tempfile.mkdtemp(prefix='jobcare-check-')
+    app = app_module.create_app({'SQLALCHEMY_DATABASE_URI': 'sqlite:///' + os.path.join(workdir, 'check.db'),
+                                 'APPLICATIONS_PER_PAGE': 10 * applications})
+    with app.app_context():
+        db.create_all()
+        expected_rows = seed(app_module, db, applications)
+
+    client = app.test_client()
+    client.post('/login', data={'email': 'company@bench.test', 'password': 'bench'})
+    recorded = []
+    with app.app_context():
+        event.listen(db.engine, 'before_cursor_execute',
+                     lambda conn, cursor, statement, *args: recorded.append(' '.join(statement.split())))
+
+    results = {}
+    for label, query_string in VIEWS:
+        client.get('/company/view_applications', query_string=query_string)  # warms the identity cache
+        recorded.clear()
+        response = client.get('/company/view_applications', query_string=query_string)
+        if response.status_code != 200 or response.data.count(b'Update Status') != expected_rows:
+            raise SystemExit(f'{label}: unexpected response (HTTP {response.status_code})')
+        results[label] = list(recorded)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check view_applications issues a fixed number of statements.')
+    parser.add_argument('--applications', type=int, default=20, help='N; the second dataset has 10 x N')
+    args = parser.parse_args()
+
+    os.environ.setdefault('BCRYPT_LOG_ROUNDS', '4')
+    os.environ.setdefault('PASSWORD_HASH_WORKERS', '0')
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    import app as app_module
+
+    small = statements_per_view(app_module, args.applications)
+    large = statements_per_view(app_module, 10 * args.applications)
+
+    failed = False
+    for label, _ in VIEWS:
+        print(f'{label:<8} {args.applications:>6} applications: {len(small[label])} statements  '
+              f'{10 * args.applications:>6} applications: {len(large[label])} statements')
+        if len(small[label]) != len(large[label]):
+            failed = True
+            for statement in large[label]:
+                print('    ' + statement[:160])
+
+    if failed:
+        print('FAILED: the statement count grows with the number of applications')
+        sys.exit(1)
+    print('OK')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,306 @@
+# ===========================================================================================
+#        Load test: seeded dataset, real routes, latency/throughput/query counts as JSON
+# ===========================================================================================
+# Seeds a synthetic dataset (students with StudentDetails, companies, vacancies,
+# applications and resumes) into a throwaway database, then drives the real Flask
+# routes through the test client from --concurrency threads, one route at a time.
+# For every route it reports requests/sec, p50/p95/p99 latency and SQL statements per
+# request (from the app's own per-endpoint SQL stats). Results go to stdout as JSON,
+# and to --output as well, so runs can be diffed between releases.
+#
+#   python benchmarks/load_test.py --students 2000 --vacancies 5000 --concurrency 8 --output results.json
+#
+# The same --seed always produces the same dataset and request mix. Point --database-url
+# at a scratch MySQL/PostgreSQL database to measure a server backend; it must be empty.
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+SKILLS = ['python', 'flask', 'sql', 'java', 'react', 'docker', 'aws', 'excel', 'marketing', 'sales',
+          'design', 'figma', 'go', 'kubernetes', 'pandas', 'testing', 'linux', 'communication']
+LOCATIONS = ['Pune', 'Delhi', 'Mumbai', 'Bengaluru', 'Hyderabad', 'Remote']
+PASSWORD = 'bench'
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(fraction * (len(ordered) - 1))))]
+
+
+# A minimal but valid one-page PDF (catalog, page tree, font, content stream, xref and
+# trailer) whose words pypdf can extract, so uploads take the same path as real resumes
+def fake_pdf(rng, words=200):
+    text = [rng.choice(SKILLS) for _ in range(words)]
+    lines = [' '.join(text[start:start + 12]) for start in range(0, words, 12)]
+    content = ('BT /F1 10 Tf 14 TL 50 800 Td ' + ' '.join(f'({line}) Tj T*' for line in lines) + ' ET').encode('ascii')
+    objects = [
+        b'<< /Type /Catalog /Pages 2 0 R >>',
+        b'<< /Type /Pages /Kids [3 0 R] /Count 1 >>',
+        b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] /Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>',
+        b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>',
+        b'<< /Length %d >>\nstream\n%s\nendstream' % (len(content), content),
+    ]
+    pdf = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(pdf))
+        pdf += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+    xref = len(pdf)
+    pdf += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    pdf += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+    pdf += b'trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n' % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def seed(app_module, db, args, rng):
+    password = app_module.bcrypt.generate_password_hash(PASSWORD).decode('utf-8')
+    now = datetime.utcnow()
+
+    db.session.execute(db.insert(app_module.User), [
+        {'username': f'student{i}', 'email': f'student{i}@load.test', 'password': password, 'role': 'student'}
+        for i in range(args.students)
+    ] + [
+        {'username': f'company{i}', 'email': f'company{i}@load.test', 'password': password, 'role': 'company'}
+        for i in range(args.companies)
+    ])
+    users = dict(db.session.query(app_module.User.email, app_module.User.id))
+    student_ids = [users[f'student{i}@load.test'] for i in range(args.students)]
+    company_ids = [users[f'company{i}@load.test'] for i in range(args.companies)]
+
+    details = [
+        {'user_id': user_id, 'education': 'B.Tech', 'skills': ', '.join(rng.sample(SKILLS, 4)),
+         'contact': '9999999999', 'address': rng.choice(LOCATIONS)}
+        for user_id in student_ids
+    ]
+    db.session.execute(db.insert(app_module.StudentDetails), details)
+    for row in details:
+        app_module.index_student_skills(row['user_id'], row['skills'])
+
+    vacancies = [
+        {'company_id': rng.choice(company_ids), 'title': f'{rng.choice(SKILLS).title()} Engineer {i}',
+         'description': 'Looking for ' + ', '.join(rng.sample(SKILLS, 5)), 'location': rng.choice(LOCATIONS),
+         'posted_date': now - timedelta(minutes=i), 'last_date': now + timedelta(days=rng.randint(1, 90))}
+        for i in range(args.vacancies)
+    ]
+    db.session.execute(db.insert(app_module.Vacancy), vacancies)
+    vacancy_ids = [row[0] for row in db.session.query(app_module.Vacancy.id).order_by(app_module.Vacancy.id)]
+    app_module.vacancy_search().rebuild(db.session)
+    app_module.index_vacancy_skills([dict(row, id=vacancy_id) for row, vacancy_id in zip(vacancies, vacancy_ids)])
+    app_module.create_application_stats(vacancy_ids)
+
+    applications = []
+    for student_id in student_ids:
+        for vacancy_id in rng.sample(vacancy_ids, min(args.applications_per_student, len(vacancy_ids))):
+            applications.append({'student_id': student_id, 'vacancy_id': vacancy_id,
+                                 'status': rng.choice(['Pending', 'Pending', 'Selected', 'Rejected']), 'applied_date': now})
+    if applications:
+        db.session.execute(db.insert(app_module.Application), applications)
+
+    # Every seeded resume shares one content-addressed blob, like re-uploads of the same file
+    if args.resumes_per_student:
+        from werkzeug.datastructures import FileStorage
+        blob_hash = app_module.store_resume_blob(FileStorage(io.BytesIO(fake_pdf(rng)), filename='resume.pdf'))
+        db.session.flush()
+        db.session.execute(db.insert(app_module.Resume), [
+            {'user_id': student_id, 'filename': f'resume-{n}.pdf', 'blob_hash': blob_hash}
+            for student_id in student_ids for n in range(args.resumes_per_student)
+        ])
+        db.session.execute(db.update(app_module.ResumeBlob).where(app_module.ResumeBlob.sha256 == blob_hash)
+                           .values(ref_count=len(student_ids) * args.resumes_per_student))
+    db.session.commit()
+    app_module.reconcile_application_stats()
+
+    return {'students': len(student_ids), 'companies': len(company_ids), 'vacancies': len(vacancy_ids),
+            'applications': len(applications), 'resumes': len(student_ids) * args.resumes_per_student}, vacancy_ids
+
+
+def logged_in_client(app, email):
+    client = app.test_client()
+    response = client.post('/login', data={'email': email, 'password': PASSWORD})
+    if response.status_code != 302:
+        raise RuntimeError(f'could not log in as {email}: HTTP {response.status_code}')
+    return client
+
+
+# Each scenario: (route, its endpoint, role of the logged-in client or None, request function, expected statuses)
+def scenarios(vacancy_ids, students):
+    def login(client, rng, number):
+        return client.post('/login', data={'email': f'student{number % students}@load.test', 'password': PASSWORD})
+
+    def student_dashboard(client, rng, number):
+        return client.get('/studentDashboard')
+
+    def company_dashboard(client, rng, number):
+        return client.get('/companyDashboard')
+
+    def student_vacancies(client, rng, number):
+        if number % 2:
+            return client.get('/student/vacancies', query_string={'location': rng.choice(LOCATIONS)})
+        return client.get('/student/vacancies')
+
+    def apply_vacancy(client, rng, number):
+        return client.post(f'/student/apply/{rng.choice(vacancy_ids)}')
+
+    def view_applications(client, rng, number):
+        return client.get('/company/view_applications', query_string={'page': rng.randint(1, 3)})
+
+    def upload_resume(client, rng, number):
+        return client.post('/upload_resume', data={'resume': (io.BytesIO(fake_pdf(rng)), f'resume-{number}.pdf')},
+                           content_type='multipart/form-data')
+
+    return [
+        ('login', 'auth.login', None, login, {302}),
+        ('studentDashboard', 'student.studentDashboard', 'student', student_dashboard, {200}),
+        ('companyDashboard', 'company.companyDashboard', 'company', company_dashboard, {200}),
+        ('student_vacancies', 'vacancy.student_vacancies', 'student', student_vacancies, {200}),
+        ('apply_vacancy', 'student.apply_vacancy', 'student', apply_vacancy, {302}),
+        ('view_applications', 'company.view_applications', 'company', view_applications, {200}),
+        ('upload_resume', 'resume.upload_resume', 'student', upload_resume, {302}),
+    ]
+
+
+def run_route(app_module, clients, request_fn, expected, total, rng_seed):
+    latencies = []
+    errors = []
+    lock = threading.Lock()
+    counter = iter(range(total))
+    counter_lock = threading.Lock()
+
+    def worker(client_index):
+        rng = random.Random(rng_seed + client_index)
+        client = clients[client_index]
+        while True:
+            with counter_lock:
+                number = next(counter, None)
+            if number is None:
+                return
+            started = time.perf_counter()
+            response = request_fn(client, rng, number)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with lock:
+                latencies.append(elapsed_ms)
+                if response.status_code not in expected:
+                    errors.append(response.status_code)
+
+    with app_module.sql_stats_lock:
+        app_module.sql_stats.clear()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+        list(pool.map(worker, range(len(clients))))
+    wall_seconds = time.perf_counter() - started
+    return latencies, errors, wall_seconds
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Seed a synthetic dataset and load-test the main routes.')
+    parser.add_argument('--students', type=int, default=1000)
+    parser.add_argument('--companies', type=int, default=50)
+    parser.add_argument('--vacancies', type=int, default=2000)
+    parser.add_argument('--applications-per-student', type=int, default=5)
+    parser.add_argument('--resumes-per-student', type=int, default=1)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--requests', type=int, default=400, help='requests per route')
+    parser.add_argument('--routes', default='', help='comma-separated subset of routes to run')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--database-url', help='empty scratch database; defaults to a temporary SQLite file')
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    args = parser.parse_args()
+
+    # Uploaded files land in a scratch directory instead of the checkout
+    output_path = os.path.abspath(args.output) if args.output else None
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    workdir = tempfile.mkdtemp(prefix='jobcare-load-')
+    os.chdir(workdir)
+    os.environ['DATABASE_URL'] = args.database_url or 'sqlite:///' + os.path.join(workdir, 'load.db')
+    os.environ.setdefault('BCRYPT_LOG_ROUNDS', '4')
+    # Every client thread shares this one process's hash pool, like a threaded worker with
+    # --concurrency threads; admit them all so login measures hashing, not the 503 path
+    os.environ.setdefault('PASSWORD_HASH_MAX_PENDING', str(args.concurrency))
+    sys.path.insert(0, repo_root)
+    import app as app_module
+
+    app, db = app_module.create_app(), app_module.db
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+    with app.app_context():
+        db.create_all()
+        dataset, vacancy_ids = seed(app_module, db, args, rng)
+        dialect = db.engine.dialect.name
+    seed_seconds = time.perf_counter() - started
+
+    selected = {name.strip() for name in args.routes.split(',') if name.strip()}
+    route_list = [scenario for scenario in scenarios(vacancy_ids, dataset['students']) if not selected or scenario[0] in selected]
+
+    routes = {}
+    for index, (name, endpoint, role, request_fn, expected) in enumerate(route_list):
+        if role == 'student':
+            clients = [logged_in_client(app, f'student{i % dataset["students"]}@load.test') for i in range(args.concurrency)]
+        elif role == 'company':
+            clients = [logged_in_client(app, f'company{i % dataset["companies"]}@load.test') for i in range(args.concurrency)]
+        else:
+            clients = [app.test_client() for _ in range(args.concurrency)]
+
+        latencies, errors, wall_seconds = run_route(app_module, clients, request_fn, expected, args.requests,
+                                                    args.seed * 1000 + index * 100)
+        with app_module.sql_stats_lock:
+            stats = app_module.sql_stats.get(endpoint)
+            statements = stats['statements'] / stats['requests'] if stats else 0
+            db_time_ms = stats['db_time_ms'] / stats['requests'] if stats else 0
+        routes[name] = {
+            'requests': len(latencies),
+            'errors': len(errors),
+            'error_statuses': sorted(set(errors)),
+            'requests_per_sec': round(len(latencies) / wall_seconds, 1),
+            'latency_ms': {
+                'mean': round(statistics.fmean(latencies), 2),
+                'p50': round(percentile(latencies, 0.50), 2),
+                'p95': round(percentile(latencies, 0.95), 2),
+                'p99': round(percentile(latencies, 0.99), 2),
+                'max': round(max(latencies), 2),
+            },
+            'queries_per_request': round(statements, 2),
+            'db_time_ms_per_request': round(db_time_ms, 2),
+        }
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=repo_root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    report = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+            'commit': commit,
+            'python': platform.python_version(),
+            'database': dialect,
+            'concurrency': args.concurrency,
+            'requests_per_route': args.requests,
+            'seed': args.seed,
+            'seed_seconds': round(seed_seconds, 2),
+        },
+        'dataset': dataset,
+        'routes': routes,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if output_path:
+        with open(output_path, 'w') as out:
+            out.write(output + '\n')
+
+    if any(route['errors'] for route in routes.values()):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
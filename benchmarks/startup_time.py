@@ -0,0 +1,200 @@
+# ===========================================================================================
+#        Startup time: import, create_app and first-request latency per worker
+# ===========================================================================================
+# Measures what a new worker pays before it serves at full speed, in two modes:
+#   cold     each worker is a fresh interpreter that imports the app and calls create_app()
+#            (gunicorn without preload_app, `flask run`)
+#   preload  a master imports the app, calls create_app() and warm_up() once, then forks the
+#            workers, which call init_worker() like gunicorn.conf.py's post_fork hook
+# Every worker then sends each request in REQUESTS twice against a small seeded SQLite
+# database: the first time shows the one-off startup cost, the second the warm latency.
+# ready_ms is the time from process start (cold) or fork (preload) until the worker has
+# answered all of its first requests. Workers run one after another so they do not compete
+# for CPU. The run fails if importing the app loads a module that is meant to be imported
+# lazily, so heavy imports cannot creep back into worker startup.
+#
+#   python benchmarks/startup_time.py --workers 8 [--output startup.json]
+import argparse
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+import load_test
+
+LAZY_MODULES = ['numpy', 'pypdf', 'PIL', 'brotli', 'alembic', 'flask_migrate',
+                'sqlalchemy.dialects.mysql', 'sqlalchemy.dialects.postgresql']
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def login(client):
+    return client.post('/login', data={'email': 'student0@load.test', 'password': load_test.PASSWORD})
+
+
+# (name, request function, expected statuses); runs in order on one client, so later
+# requests are logged in
+REQUESTS = [
+    ('login_page', lambda client: client.get('/login'), {200}),
+    ('login', login, {302}),
+    ('studentDashboard', lambda client: client.get('/studentDashboard'), {200}),
+    ('student_vacancies', lambda client: client.get('/student/vacancies'), {200}),
+    ('search_vacancies', lambda client: client.get('/student/vacancies/search', query_string={'q': 'python'}), {200}),
+]
+
+
+def timed_ms(function):
+    started = time.perf_counter()
+    result = function()
+    return (time.perf_counter() - started) * 1000, result
+
+
+def serve_requests(app):
+    client = app.test_client()
+    first, second, errors = {}, {}, []
+    for timings in (first, second):
+        for name, request_fn, expected in REQUESTS:
+            timings[name], response = timed_ms(lambda: request_fn(client))
+            if response.status_code not in expected:
+                errors.append(f'{name}: HTTP {response.status_code}')
+    return first, second, errors
+
+
+def import_app():
+    sys.path.insert(0, REPO_ROOT)
+    import_ms, app_module = timed_ms(lambda: __import__('app'))
+    return import_ms, app_module, [name for name in LAZY_MODULES if name in sys.modules]
+
+
+# One cold worker: everything happens in this fresh interpreter
+def run_cold_worker(started_at):
+    import_ms, app_module, eager = import_app()
+    create_ms, app = timed_ms(app_module.create_app)
+    first, second, errors = serve_requests(app)
+    print(json.dumps({'import_ms': import_ms, 'create_app_ms': create_ms, 'first_request_ms': first,
+                      'warm_request_ms': second, 'ready_ms': (time.time() - started_at) * 1000,
+                      'eager_modules': eager, 'errors': errors}))
+
+
+# The preload master: build and warm the app once, then fork the workers one at a time
+def run_preload_master(workers):
+    import_ms, app_module, eager = import_app()
+    create_ms, app = timed_ms(app_module.create_app)
+    warm_up_ms, _ = timed_ms(lambda: app_module.warm_up(app))
+
+    results = []
+    for _ in range(workers):
+        read_fd, write_fd = os.pipe()
+        forked_at = time.time()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            init_ms, _ = timed_ms(lambda: app_module.init_worker(app))
+            first, second, errors = serve_requests(app)
+            report = {'init_worker_ms': init_ms, 'first_request_ms': first, 'warm_request_ms': second,
+                      'ready_ms': (time.time() - forked_at) * 1000, 'errors': errors}
+            with os.fdopen(write_fd, 'w') as out:
+                out.write(json.dumps(report))
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd) as pipe:
+            results.append(json.loads(pipe.read()))
+        os.waitpid(pid, 0)
+    print(json.dumps({'import_ms': import_ms, 'create_app_ms': create_ms, 'warm_up_ms': warm_up_ms,
+                      'eager_modules': eager, 'workers': results}))
+
+
+def run_setup():
+    _, app_module, _ = import_app()
+    app = app_module.create_app()
+    with app.app_context():
+        app_module.db.create_all()
+        load_test.seed(app_module, app_module.db, SimpleNamespace(
+            students=50, companies=5, vacancies=200, applications_per_student=3, resumes_per_student=0), random.Random(1))
+
+
+def child(*args):
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), *args], capture_output=True, text=True)
+    if result.returncode != 0:
+        sys.stderr.write(result.stderr)
+        raise SystemExit(f'{args[0]} failed')
+    return json.loads(result.stdout.strip().splitlines()[-1]) if result.stdout.strip() else None
+
+
+def summarize(values):
+    return {'median': round(statistics.median(values), 2), 'max': round(max(values), 2)}
+
+
+def summarize_workers(workers, keys):
+    summary = {key: summarize([worker[key] for worker in workers]) for key in keys}
+    for timings in ('first_request_ms', 'warm_request_ms'):
+        summary[timings] = {name: summarize([worker[timings][name] for worker in workers]) for name, _, _ in REQUESTS}
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure worker startup: import, create_app and first-request latency.')
+    parser.add_argument('--workers', type=int, default=5, help='workers to start in each mode')
+    parser.add_argument('--output', help='also write the JSON report to this file')
+    parser.add_argument('--role', choices=['setup', 'cold', 'preload'], help=argparse.SUPPRESS)
+    parser.add_argument('--started-at', type=float, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.role == 'setup':
+        return run_setup()
+    if args.role == 'cold':
+        return run_cold_worker(args.started_at)
+    if args.role == 'preload':
+        return run_preload_master(args.workers)
+
+    # Children inherit a scratch working directory and database; inline hashing and
+    # extraction keep pool start-up out of the numbers
+    output_path = os.path.abspath(args.output) if args.output else None
+    workdir = tempfile.mkdtemp(prefix='jobcare-startup-')
+    os.chdir(workdir)
+    os.environ['DATABASE_URL'] = 'sqlite:///' + os.path.join(workdir, 'startup.db')
+    os.environ.setdefault('BCRYPT_LOG_ROUNDS', '4')
+    os.environ['PASSWORD_HASH_WORKERS'] = '0'
+    os.environ['RESUME_EXTRACT_WORKERS'] = '0'
+    child('--role', 'setup')
+
+    cold = []
+    for _ in range(args.workers):
+        started_at = time.time()
+        cold.append(child('--role', 'cold', '--started-at', repr(started_at)))
+    preload = child('--role', 'preload', '--workers', str(args.workers))
+
+    eager = sorted(set(preload['eager_modules']).union(*(worker['eager_modules'] for worker in cold)))
+    errors = sorted(set(error for worker in cold + preload['workers'] for error in worker['errors']))
+    report = {
+        'meta': {
+            'timestamp': datetime.utcnow().isoformat(timespec='seconds') + 'Z',
+            'python': platform.python_version(),
+            'workers': args.workers,
+        },
+        'cold': summarize_workers(cold, ['import_ms', 'create_app_ms', 'ready_ms']),
+        'preload': dict(
+            master={key: round(preload[key], 2) for key in ('import_ms', 'create_app_ms', 'warm_up_ms')},
+            **summarize_workers(preload['workers'], ['init_worker_ms', 'ready_ms']),
+        ),
+        'eager_modules': eager,
+        'errors': errors,
+    }
+    output = json.dumps(report, indent=2)
+    print(output)
+    if output_path:
+        with open(output_path, 'w') as out:
+            out.write(output + '\n')
+
+    if eager or errors:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,30 @@
+# ===========================================================================================
+#                              gunicorn settings
+# ===========================================================================================
+#   gunicorn -c gunicorn.conf.py
+#
+# The master imports the app, builds it with create_app() and warms it up once, then forks
+# the workers, which share that memory copy-on-write and serve their first request without
+# importing or compiling anything. Whatever must not cross a fork (database connections,
+# the hashing/thumbnail/resume pools, the archive thread) is created lazily in each worker.
+# Those pools and their limits are per worker, so their sizes multiply by `workers`; see
+# "Password hashing pool" in app.py for what that means with sync workers.
+import os
+
+wsgi_app = 'app:create_app()'
+preload_app = True
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:8000')
+workers = int(os.environ.get('WEB_CONCURRENCY', 2 * (os.cpu_count() or 1) + 1))
+threads = int(os.environ.get('GUNICORN_THREADS', 1))
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 30))
+
+
+def when_ready(server):
+    if server.cfg.preload_app:
+        from app import warm_up
+        warm_up(server.app.wsgi())
+
+
+def post_fork(server, worker):
+    from app import init_worker
+    init_worker(server.app.wsgi())
@@ -0,0 +1,47 @@
+"""archive surrogate ids
+
+Archived vacancies and applications keep the id they had while live in
+original_id and get ids of their own, since SQLite hands a deleted row's id out
+again. Rows archived so far keep their id, which is also their original_id.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 10:41:27.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0004'
+down_revision = '0003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('archived_vacancy', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('original_id', sa.Integer(), nullable=True))
+
+    with op.batch_alter_table('archived_application', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('original_id', sa.Integer(), nullable=True))
+
+    op.execute('UPDATE archived_vacancy SET original_id = id')
+    op.execute('UPDATE archived_application SET original_id = id')
+
+    with op.batch_alter_table('archived_vacancy', schema=None) as batch_op:
+        batch_op.alter_column('original_id', existing_type=sa.Integer(), nullable=False)
+        batch_op.create_unique_constraint('uq_archived_vacancy_original_id_archived_at', ['original_id', 'archived_at'])
+
+    with op.batch_alter_table('archived_application', schema=None) as batch_op:
+        batch_op.alter_column('original_id', existing_type=sa.Integer(), nullable=False)
+
+
+def downgrade():
+    with op.batch_alter_table('archived_application', schema=None) as batch_op:
+        batch_op.drop_column('original_id')
+
+    with op.batch_alter_table('archived_vacancy', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_archived_vacancy_original_id_archived_at', type_='unique')
+        batch_op.drop_column('original_id')
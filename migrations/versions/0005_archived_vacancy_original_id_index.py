@@ -0,0 +1,33 @@
+"""archived vacancy original_id index
+
+Archived applications are matched to their archived vacancy by original_id (the
+newest archived row for it) rather than by original_id and archived_at, which
+second-precision DATETIME columns cannot tell apart. The unique constraint on
+the pair goes; a plain index on original_id serves the lookup.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 11:02:45.640917
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '0005'
+down_revision = '0004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('archived_vacancy', schema=None) as batch_op:
+        batch_op.drop_constraint('uq_archived_vacancy_original_id_archived_at', type_='unique')
+        batch_op.create_index('ix_archived_vacancy_original_id', ['original_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('archived_vacancy', schema=None) as batch_op:
+        batch_op.drop_index('ix_archived_vacancy_original_id')
+        batch_op.create_unique_constraint('uq_archived_vacancy_original_id_archived_at', ['original_id', 'archived_at'])